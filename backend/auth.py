@@ -10,31 +10,59 @@ Security layer:
 """
 
 import os
+import hmac
 import time
+import asyncio
 import hashlib
 import secrets
 import logging
-from collections import defaultdict
-from fastapi import Request, HTTPException, Security
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+try:
+    from blake3 import blake3
+except ImportError:  # optional accelerator
+    blake3 = None
+
+from fastapi import HTTPException, Security
 from fastapi.security import APIKeyHeader
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("auth")
 
+# ── Request Auth Context ────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Per-request auth facts resolved once by AuthMiddleware."""
+    client_ip: str
+    api_key: Optional[str]
+    localhost_bypass: bool  # let through as localhost; api_key was NOT validated
+
+
+# Set by AuthMiddleware for every non-exempt HTTP request
+auth_ctx: ContextVar[AuthContext] = ContextVar("auth_ctx")
+
+
 # ── API Key Management ──────────────────────────────────────────────
 
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-# Store hashed keys (never store raw API keys)
-_valid_key_hashes: set = set()
+# Store hashed keys (never store raw API keys) as raw 32-byte digests.
+# The set only lives in memory and is rebuilt from raw keys at startup, so the
+# hash function can change between runs without migrating anything.
+_valid_key_hashes: set[bytes] = set()
 
 
 def generate_api_key() -> str:
     """Generate a new API key. Display it once, then store only the hash."""
     key = f"smm_{secrets.token_urlsafe(32)}"
-    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    key_hash = _hash_key(key)
     _valid_key_hashes.add(key_hash)
-    logger.info(f"New API key generated (hash: {key_hash[:12]}...)")
+    logger.info(f"New API key generated (hash: {key_hash.hex()[:12]}...)")
     return key
 
 
@@ -42,7 +70,7 @@ def load_api_key_from_env():
     """Load API key from environment variable."""
     key = os.getenv("MM_API_KEY")
     if key:
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        key_hash = _hash_key(key)
         _valid_key_hashes.add(key_hash)
         logger.info("API key loaded from environment")
     else:
@@ -54,16 +82,34 @@ def load_api_key_from_env():
         print(f"{'='*60}\n")
 
 
+def _hash_key(key: str) -> bytes:
+    """Hash a raw API key the way it is stored (BLAKE3 if installed, else SHA-256)."""
+    if blake3 is not None:
+        return blake3(key.encode()).digest()
+    return hashlib.sha256(key.encode()).digest()
+
+
+def _is_valid_hash(key_hash: bytes) -> bool:
+    """Constant-time check of a key hash against every stored hash."""
+    valid = False
+    for known_hash in _valid_key_hashes:
+        if hmac.compare_digest(key_hash, known_hash):
+            valid = True
+    return valid
+
+
 def validate_api_key(key: str) -> bool:
     """Validate an API key by comparing hashes."""
     if not key:
         return False
-    key_hash = hashlib.sha256(key.encode()).hexdigest()
-    return key_hash in _valid_key_hashes
+    return _is_valid_hash(_hash_key(key))
 
 
 async def require_api_key(api_key: str = Security(API_KEY_HEADER)):
     """FastAPI dependency — use on protected endpoints."""
+    ctx = auth_ctx.get(None)
+    if ctx is not None and not ctx.localhost_bypass:
+        return ctx.api_key  # AuthMiddleware already validated this key
     if not validate_api_key(api_key):
         logger.warning("Invalid API key attempt")
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
@@ -74,34 +120,68 @@ async def require_api_key(api_key: str = Security(API_KEY_HEADER)):
 
 class RateLimiter:
     """
-    Simple sliding-window rate limiter.
-    Tracks requests per client IP within a time window.
+    GCRA (Generic Cell Rate Algorithm) rate limiter.
+
+    Allows max_requests per window_seconds per client IP. Each IP stores a
+    single float — its theoretical arrival time (TAT) — so checks are O(1)
+    in time and memory regardless of request volume.
+
+    State is split across a power-of-two number of shards, each with its own
+    lock, so dict resizes and idle-IP sweeps stay local to one shard.
     """
 
+    NUM_SHARDS = 16  # must be a power of two
+
     def __init__(self, max_requests: int = 60, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: dict = defaultdict(list)
+        # Spacing between requests at the sustained rate
+        self._emission_interval = window_seconds / max_requests
+        # How far TAT may run ahead of now (a full window allows a full burst)
+        self._burst_tolerance = float(window_seconds)
+        self._shard_mask = self.NUM_SHARDS - 1
+        self._shards: list[dict[str, float]] = [{} for _ in range(self.NUM_SHARDS)]
+        self._locks: list[Lock] = [Lock() for _ in range(self.NUM_SHARDS)]
+        self._next_sweep_shard = 0
 
     def is_allowed(self, client_ip: str) -> bool:
-        now = time.time()
-        cutoff = now - self.window_seconds
-
-        self._requests[client_ip] = [
-            t for t in self._requests[client_ip] if t > cutoff
-        ]
-
-        if len(self._requests[client_ip]) >= self.max_requests:
-            return False
-
-        self._requests[client_ip].append(now)
-        return True
+        idx = hash(client_ip) & self._shard_mask
+        shard = self._shards[idx]
+        now = time.monotonic()
+        with self._locks[idx]:
+            tat = max(shard.get(client_ip, now), now)
+            new_tat = tat + self._emission_interval
+            if new_tat - now > self._burst_tolerance:
+                return False
+            shard[client_ip] = new_tat
+            return True
 
     def get_remaining(self, client_ip: str) -> int:
-        now = time.time()
-        cutoff = now - self.window_seconds
-        current = len([t for t in self._requests.get(client_ip, []) if t > cutoff])
-        return max(0, self.max_requests - current)
+        now = time.monotonic()
+        tat = self._shards[hash(client_ip) & self._shard_mask].get(client_ip)
+        if tat is None or tat <= now:
+            return self.max_requests
+        remaining = int((self._burst_tolerance - (tat - now)) / self._emission_interval)
+        return max(0, min(self.max_requests, remaining))
+
+    def sweep_next_shard(self) -> int:
+        """Drop IPs whose budget has fully recovered from one shard. Returns count removed."""
+        idx = self._next_sweep_shard
+        self._next_sweep_shard = (idx + 1) & self._shard_mask
+        shard = self._shards[idx]
+        now = time.monotonic()
+        with self._locks[idx]:
+            idle = [ip for ip, tat in shard.items() if tat <= now]
+            for ip in idle:
+                del shard[ip]
+        return len(idle)
+
+    async def run_sweeper(self):
+        """Background task: sweep every shard once per window to bound memory."""
+        interval = self.window_seconds / self.NUM_SHARDS
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep_next_shard()
 
 
 # Global rate limiter instance
@@ -110,58 +190,78 @@ rate_limiter = RateLimiter(max_requests=120, window_seconds=60)
 
 # ── Middleware ──────────────────────────────────────────────────────
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+class AuthMiddleware:
     """
     Combined authentication + rate limiting middleware.
 
+    Implemented as a raw ASGI callable (no BaseHTTPMiddleware task group or
+    body buffering); exempt paths are passed straight through.
+
     Exempt paths (no auth required):
     - /health — for load balancer health checks
     - /docs, /openapi.json — Swagger UI (disable in production)
     - /ws/* — WebSocket connections (handled separately)
     """
 
-    EXEMPT_PATHS = {"/health", "/docs", "/openapi.json", "/redoc", "/"}
-    EXEMPT_PREFIXES = ("/ws/",)  # WebSocket paths bypass HTTP auth
+    EXEMPT_PATHS = frozenset({"/health", "/docs", "/openapi.json", "/redoc", "/"})
+    EXEMPT_PREFIXES = ("/ws/",)  # WebSocket paths bypass HTTP auth (tuple for str.startswith)
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Resolved once — allow localhost without an API key in development
+        self._allow_localhost = os.getenv("MM_ALLOW_LOCALHOST", "true").lower() == "true"
+        self._localhost_ips = frozenset(("127.0.0.1", "localhost", "::1"))
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Skip auth for exempt paths
-        if path in self.EXEMPT_PATHS:
-            return await call_next(request)
+        path = scope["path"]
 
-        # Skip auth for WebSocket and other exempt prefixes
-        if any(path.startswith(p) for p in self.EXEMPT_PREFIXES):
-            return await call_next(request)
+        # Skip auth for exempt paths, WebSocket and other exempt prefixes
+        if path in self.EXEMPT_PATHS or path.startswith(self.EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        raw_key = dict(scope["headers"]).get(b"x-api-key")
+        api_key = raw_key.decode("latin-1") if raw_key else None
+
+        # Localhost bypass (development) — no key, no rate-limit bookkeeping
+        if self._allow_localhost and client_ip in self._localhost_ips:
+            auth_ctx.set(AuthContext(client_ip=client_ip, api_key=api_key, localhost_bypass=True))
+            await self.app(scope, receive, send)
+            return
 
         # Rate limiting
-        client_ip = request.client.host if request.client else "unknown"
         if not rate_limiter.is_allowed(client_ip):
             logger.warning(f"Rate limit exceeded for {client_ip}")
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Try again later.",
-            )
-
-        # API key check — allow localhost without key in development
-        api_key = request.headers.get("X-API-Key")
-        allow_localhost = os.getenv("MM_ALLOW_LOCALHOST", "true").lower() == "true"
-        if allow_localhost and client_ip in ("127.0.0.1", "localhost", "::1"):
-            response = await call_next(request)
-            response.headers["X-RateLimit-Remaining"] = str(
-                rate_limiter.get_remaining(client_ip)
-            )
-            return response
+            await self._reject(429, "Rate limit exceeded. Try again later.", scope, receive, send)
+            return
 
         # Require API key for non-localhost
         if not validate_api_key(api_key):
-            raise HTTPException(status_code=401, detail="Invalid or missing API key")
+            await self._reject(401, "Invalid or missing API key", scope, receive, send)
+            return
 
-        response = await call_next(request)
-        response.headers["X-RateLimit-Remaining"] = str(
-            rate_limiter.get_remaining(client_ip)
-        )
-        return response
+        # Downstream code reads this instead of re-parsing headers
+        auth_ctx.set(AuthContext(client_ip=client_ip, api_key=api_key, localhost_bypass=False))
+
+        async def send_with_rate_limit(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-RateLimit-Remaining", str(rate_limiter.get_remaining(client_ip)))
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit)
+
+    @staticmethod
+    async def _reject(status_code: int, detail: str, scope: Scope, receive: Receive, send: Send):
+        response = JSONResponse({"detail": detail}, status_code=status_code)
+        await response(scope, receive, send)
 
 
 # ── Binding Safety ──────────────────────────────────────────────────
@@ -4,14 +4,14 @@ Capital Brain — Central Capital Management Module
 The Capital Brain is the single source of truth for all capital-related decisions:
 - Tracks total operational budget in USD
 - Fetches real-time SOL/USD price from Jupiter (cached)
-- Calculates available vs deployed capital from wallet balances
+- Tracks deployed capital from fills, reconciled against wallet balances
 - Converts percentage allocations to actual SOL amounts
 - Provides affordability checks before trade execution
 """
 
 import time
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger("capital_brain")
 
@@ -22,12 +22,21 @@ SOL_MINT = "So11111111111111111111111111111111111111112"
 class CapitalBrain:
     """Central capital management — the brain of the percentage-based system."""
 
-    def __init__(self, total_budget_usd: float, jupiter, cache_ttl_s: int = 60):
+    def __init__(
+        self,
+        total_budget_usd: float,
+        jupiter,
+        cache_ttl_s: int = 60,
+        reconcile_interval_s: float = 60.0,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
         """
         Args:
             total_budget_usd: Total operational budget in USD (e.g., 1000.0)
             jupiter: JupiterAdapter instance for SOL/USD price fetching
             cache_ttl_s: How long to cache SOL price (seconds)
+            reconcile_interval_s: How often to rescan the wallet pool (seconds)
+            on_change: Called when the SOL price or deployed capital changes
         """
         if total_budget_usd <= 0:
             raise ValueError("Total budget must be positive")
@@ -35,13 +44,22 @@ class CapitalBrain:
         self.total_budget_usd = total_budget_usd
         self._jupiter = jupiter
         self._cache_ttl_s = cache_ttl_s
+        self._reconcile_interval_s = reconcile_interval_s
+        self.on_change = on_change
 
-        # SOL/USD price cache
+        # SOL/USD price cache (with its reciprocal so USD->SOL is a multiply)
         self._sol_price_usd: float = 0.0
+        self._inv_sol_price: float = 0.0
         self._price_fetched_at: float = 0.0
 
-        # Capital tracking
-        self._deployed_capital_usd: float = 0.0
+        # Capital tracking — running SOL total, adjusted by on_fill() and
+        # reconciled against the wallet pool every reconcile_interval_s
+        self._deployed_sol: float = 0.0
+        self._last_reconcile: float = 0.0
+
+        # Memoized get_status() result and the inputs it was built from
+        self._status_snapshot: Optional[dict] = None
+        self._status_key: Optional[tuple] = None
 
     # ── Properties ───────────────────────────────────────────────────
 
@@ -53,19 +71,19 @@ class CapitalBrain:
     @property
     def deployed_capital_usd(self) -> float:
         """Total capital currently deployed across all wallets."""
-        return self._deployed_capital_usd
+        return self._deployed_sol * self._sol_price_usd
 
     @property
     def available_capital_usd(self) -> float:
         """Undeployed capital available for new trades."""
-        return max(0.0, self.total_budget_usd - self._deployed_capital_usd)
+        return max(0.0, self.total_budget_usd - self.deployed_capital_usd)
 
     @property
     def capital_utilization_pct(self) -> float:
         """Percentage of total budget currently deployed."""
         if self.total_budget_usd <= 0:
             return 0.0
-        return (self._deployed_capital_usd / self.total_budget_usd) * 100
+        return (self.deployed_capital_usd / self.total_budget_usd) * 100
 
     # ── Core Methods ─────────────────────────────────────────────────
 
@@ -74,8 +92,12 @@ class CapitalBrain:
         Refresh SOL/USD price and wallet balances.
         Must be called at the start of every trading cycle.
         """
+        before = (self._sol_price_usd, self._deployed_sol)
         await self._refresh_sol_price()
         await self._refresh_deployed_capital(wallet_orchestrator)
+        self._status_snapshot = None
+        if (self._sol_price_usd, self._deployed_sol) != before:
+            self._notify_change()
 
     async def _refresh_sol_price(self) -> None:
         """Fetch SOL/USD price from Jupiter with caching."""
@@ -86,7 +108,7 @@ class CapitalBrain:
         try:
             price = await self._jupiter.get_price(SOL_MINT)
             if price and price > 0:
-                self._sol_price_usd = float(price)
+                self._set_sol_price(float(price))
                 self._price_fetched_at = now
                 logger.debug(f"SOL/USD price updated: ${self._sol_price_usd:.2f}")
             else:
@@ -95,15 +117,50 @@ class CapitalBrain:
             logger.warning(f"Failed to fetch SOL price: {e}")
             # Keep using the last known price
 
+    def _set_sol_price(self, price: float) -> None:
+        """Update the cached SOL/USD price and its reciprocal together."""
+        self._sol_price_usd = price
+        self._inv_sol_price = 1.0 / price if price > 0 else 0.0
+
     async def _refresh_deployed_capital(self, wallet_orchestrator) -> None:
-        """Calculate deployed capital from wallet balances."""
-        if self._sol_price_usd <= 0:
-            logger.warning("Cannot calculate deployed capital without SOL price")
+        """
+        Reconcile deployed capital against wallet balances.
+        Between reconciliations the running total is kept current by on_fill().
+        """
+        now = time.monotonic()
+        if self._last_reconcile and (now - self._last_reconcile) < self._reconcile_interval_s:
             return
+        self._read_pool_balance(wallet_orchestrator)
 
+    def reconcile(self, wallet_orchestrator) -> None:
+        """
+        Reset deployed capital to the wallet pool's total balance right away.
+        Call after balances are refreshed or wallets are removed; on_fill()
+        only tracks the market maker's own trades.
+        """
+        before = self._deployed_sol
+        self._read_pool_balance(wallet_orchestrator)
+        if self._deployed_sol != before:
+            self._notify_change()
+
+    def _read_pool_balance(self, wallet_orchestrator) -> None:
         pool = wallet_orchestrator.get_pool_status()
-        total_sol = pool.get("total_balance_sol", 0.0)
-        self._deployed_capital_usd = total_sol * self._sol_price_usd
+        self._deployed_sol = pool.get("total_balance_sol", 0.0)
+        self._last_reconcile = time.monotonic()
+
+    def on_fill(self, delta_sol: float) -> None:
+        """
+        Apply the SOL balance change of a filled trade to the running total.
+
+        Args:
+            delta_sol: Change in pooled SOL balance (negative for buys, positive for sells)
+        """
+        self._deployed_sol = max(0.0, self._deployed_sol + delta_sol)
+        self._notify_change()
+
+    def _notify_change(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
 
     def pct_to_sol(self, percentage: float, base_usd: float) -> float:
         """
@@ -119,18 +176,18 @@ class CapitalBrain:
         Returns:
             Amount in SOL
         """
-        if self._sol_price_usd <= 0:
+        if self._inv_sol_price <= 0:
             logger.error("SOL price is zero, cannot convert to SOL")
             return 0.0
 
         usd_amount = (percentage / 100) * base_usd
-        return usd_amount / self._sol_price_usd
+        return usd_amount * self._inv_sol_price
 
     def usd_to_sol(self, amount_usd: float) -> float:
         """Convert a USD amount to SOL."""
-        if self._sol_price_usd <= 0:
+        if self._inv_sol_price <= 0:
             return 0.0
-        return amount_usd / self._sol_price_usd
+        return amount_usd * self._inv_sol_price
 
     def sol_to_usd(self, amount_sol: float) -> float:
         """Convert a SOL amount to USD."""
@@ -138,16 +195,16 @@ class CapitalBrain:
 
     def can_afford(self, amount_sol: float) -> bool:
         """Check if we have enough available capital for a trade."""
-        if self._sol_price_usd <= 0:
+        if self._inv_sol_price <= 0:
             return False
         trade_cost_usd = amount_sol * self._sol_price_usd
         return trade_cost_usd <= self.available_capital_usd
 
     def get_total_budget_sol(self) -> float:
         """Get total budget expressed in SOL at current price."""
-        if self._sol_price_usd <= 0:
+        if self._inv_sol_price <= 0:
             return 0.0
-        return self.total_budget_usd / self._sol_price_usd
+        return self.total_budget_usd * self._inv_sol_price
 
     def get_phase_allocation_usd(self, phase_capital_allocation_pct: float) -> float:
         """Get USD amount allocated to a phase."""
@@ -156,12 +213,22 @@ class CapitalBrain:
     # ── Status ───────────────────────────────────────────────────────
 
     def get_status(self) -> dict:
-        """Get capital status for API/frontend."""
+        """
+        Get capital status for API/frontend.
+        Built once per refresh (or budget change) and shared by all callers.
+        """
+        key = (self._price_fetched_at, self._deployed_sol, self.total_budget_usd)
+        if self._status_snapshot is None or self._status_key != key:
+            self._status_snapshot = self._build_status()
+            self._status_key = key
+        return dict(self._status_snapshot)  # shallow copy: callers may add keys
+
+    def _build_status(self) -> dict:
         return {
             "total_budget_usd": self.total_budget_usd,
             "total_budget_sol": self.get_total_budget_sol(),
-            "deployed_capital_usd": self._deployed_capital_usd,
-            "deployed_capital_sol": self.usd_to_sol(self._deployed_capital_usd),
+            "deployed_capital_usd": self.deployed_capital_usd,
+            "deployed_capital_sol": self.usd_to_sol(self.deployed_capital_usd),
             "available_capital_usd": self.available_capital_usd,
             "available_capital_sol": self.usd_to_sol(self.available_capital_usd),
             "capital_utilization_pct": round(self.capital_utilization_pct, 1),
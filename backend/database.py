@@ -5,11 +5,18 @@ Schema: Orders, Positions, Transactions, AuditLog, PriceHistory, WalletSnapshots
 SQLite for dev, PostgreSQL-ready schema.
 """
 
+import os
+import asyncio
 import sqlite3
-import json
 import time
+import orjson
 import uuid
+import secrets
+import itertools
+import queue
+import atexit
 import logging
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 from typing import Optional
@@ -17,6 +24,17 @@ from dataclasses import dataclass, asdict
 
 logger = logging.getLogger("database")
 
+def _dumps(value) -> str:
+    """Serialize a JSON column value (TEXT) with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _rows_to_dicts(cur: sqlite3.Cursor) -> list:
+    """Materialize a result set as dicts, reading column names once per query."""
+    cols = [c[0] for c in cur.description]
+    return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+
 # Default database path
 DB_PATH = Path("data/trading.db")
 
@@ -27,21 +45,131 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
-@contextmanager
-def get_connection():
-    """Thread-safe database connection context manager."""
-    conn = sqlite3.connect(str(get_db_path()), timeout=10)
+# Record IDs: random per-process prefix + counter + ms timestamp. Unique and
+# much cheaper than uuid4(); set MM_CANONICAL_UUIDS=true if an external
+# system needs canonical UUID strings.
+_USE_CANONICAL_UUIDS = os.getenv("MM_CANONICAL_UUIDS", "false").lower() == "true"
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    if _USE_CANONICAL_UUIDS:
+        return str(uuid.uuid4())
+    return f"{_ID_PREFIX}{next(_id_counter):012x}{int(time.time() * 1000):x}"
+
+
+# One long-lived connection per thread; pragmas run once when it is opened
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pooled_connections: list = []
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open a pooled connection and apply per-connection pragmas once."""
+    conn = sqlite3.connect(
+        str(get_db_path()), timeout=10,
+        check_same_thread=False, isolation_level=None,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    # synchronous=NORMAL in WAL mode skips the fsync on every commit; a power
+    # loss can drop the last few transactions but never corrupts the database.
+    # Worth it for the append-heavy audit/price/snapshot tables (~2x writes).
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    with _pool_lock:
+        _pooled_connections.append(conn)
+    return conn
+
+
+def _thread_connection() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _open_connection()
+        _local.conn = conn
+    return conn
+
+
+@atexit.register
+def close_pooled_connections():
+    """Close every pooled connection (registered with atexit)."""
+    with _pool_lock:
+        conns = list(_pooled_connections)
+        _pooled_connections.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _local.__dict__.pop("conn", None)
+
+
+_WAL_CHECKPOINT_MODES = frozenset({"PASSIVE", "FULL", "RESTART", "TRUNCATE"})
+
+
+def checkpoint_wal(mode: str = "TRUNCATE") -> tuple:
+    """
+    Copy the WAL back into the database file. TRUNCATE also resets the WAL
+    to zero bytes, which keeps it bounded under constant write traffic.
+    Returns SQLite's (busy, wal_pages, checkpointed_pages).
+    """
+    if mode not in _WAL_CHECKPOINT_MODES:
+        raise ValueError(f"Invalid WAL checkpoint mode: {mode}")
+    conn = _thread_connection()  # must run outside a transaction
+    return tuple(conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone())
+
+
+async def run_wal_checkpointer(interval_s: float = 300.0):
+    """Background task: checkpoint (TRUNCATE) the WAL every interval_s, off the event loop."""
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            busy, wal_pages, done = await asyncio.to_thread(checkpoint_wal)
+            if busy:
+                logger.debug(f"WAL checkpoint incomplete ({done}/{wal_pages} pages), readers busy")
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+
+
+@contextmanager
+def get_connection():
+    """
+    Thread-local pooled connection wrapped in a transaction.
+    Nested use joins the outer transaction; only the outermost block commits.
+    """
+    conn = _thread_connection()
+    owns_tx = not conn.in_transaction
+    if owns_tx:
+        conn.execute("BEGIN")
     try:
         yield conn
-        conn.commit()
+        if owns_tx and conn.in_transaction:
+            conn.execute("COMMIT")
     except Exception:
-        conn.rollback()
+        if owns_tx and conn.in_transaction:
+            conn.execute("ROLLBACK")
         raise
-    finally:
-        conn.close()
+
+
+@contextmanager
+def db_transaction():
+    """
+    Group several write helpers (create_order, upsert_position, ...) into one
+    commit on this thread's connection; their own get_connection() blocks join
+    it. Keep the block synchronous: nothing may be awaited inside it.
+    """
+    outermost = not _thread_connection().in_transaction
+    with get_connection():
+        yield
+    if outermost:
+        # Order writes bumped the generation before they were visible; bump
+        # again so stats computed in between are not cached as current
+        _bump_orders_generation()
 
 
 def init_database():
@@ -128,11 +256,15 @@ def init_database():
                 timestamp REAL NOT NULL
             );
 
-            CREATE INDEX IF NOT EXISTS idx_orders_wallet ON orders(wallet_address);
+            -- (wallet_address, created_at DESC) serves wallet lookups and their ordering,
+            -- superseding the single-column wallet/type indexes
+            DROP INDEX IF EXISTS idx_orders_wallet;
+            DROP INDEX IF EXISTS idx_audit_type;
+            CREATE INDEX IF NOT EXISTS idx_orders_wallet_created ON orders(wallet_address, created_at DESC);
             CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
             CREATE INDEX IF NOT EXISTS idx_orders_created ON orders(created_at);
             CREATE INDEX IF NOT EXISTS idx_transactions_order ON transactions(order_id);
-            CREATE INDEX IF NOT EXISTS idx_audit_type ON audit_log(event_type);
+            CREATE INDEX IF NOT EXISTS idx_audit_type_time ON audit_log(event_type, timestamp DESC);
             CREATE INDEX IF NOT EXISTS idx_audit_time ON audit_log(timestamp);
             CREATE INDEX IF NOT EXISTS idx_price_token_time ON price_history(token_mint, timestamp);
             CREATE INDEX IF NOT EXISTS idx_wallet_snap_time ON wallet_snapshots(wallet_address, timestamp);
@@ -155,6 +287,15 @@ def init_database():
 
 # ── Order Operations ────────────────────────────────────────────────
 
+# Bumped on every order write; analytics caches keyed on it go stale immediately
+_orders_generation = 0
+
+
+def _bump_orders_generation():
+    global _orders_generation
+    _orders_generation += 1
+
+
 def create_order(
     wallet_address: str,
     token_mint: str,
@@ -166,7 +307,7 @@ def create_order(
     risk_decision: str = "",
 ) -> str:
     """Create a new order record. Returns order_id."""
-    order_id = str(uuid.uuid4())
+    order_id = _new_id()
     now = time.time()
 
     with get_connection() as conn:
@@ -180,6 +321,7 @@ def create_order(
              quantity_sol, expected_price, now, now,
              strategy_reason, risk_decision),
         )
+    _bump_orders_generation()
 
     log_audit_event("order", "system", "create_order", f"order:{order_id}",
                     "success", {"side": side, "amount": quantity_sol, "token": token_mint})
@@ -208,6 +350,7 @@ def update_order_status(
             (status, now, filled_quantity, average_fill_price,
              slippage_percent, error_message, order_id),
         )
+    _bump_orders_generation()
 
     log_audit_event("order", "system", "update_status", f"order:{order_id}",
                     status, {"new_status": status})
@@ -216,19 +359,19 @@ def update_order_status(
 def get_recent_orders(limit: int = 50) -> list:
     """Get recent orders for the dashboard."""
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM orders ORDER BY created_at DESC LIMIT ?", (limit,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 def get_orders_by_wallet(wallet_address: str, limit: int = 50) -> list:
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM orders WHERE wallet_address = ? ORDER BY created_at DESC LIMIT ?",
             (wallet_address, limit),
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 # ── Position Operations ─────────────────────────────────────────────
@@ -239,76 +382,73 @@ def upsert_position(
     quantity_delta: float,
     price: float,
 ):
-    """Update or create position. Handles average entry price calculation."""
+    """
+    Update or create position. Handles average entry price calculation.
+
+    Single atomic INSERT ... ON CONFLICT statement (UNIQUE(wallet_address, token_mint)):
+    - buy into a non-negative position: volume-weighted average entry price
+    - sell: realize PnL against the current average entry price
+    - quantity reaching zero or below closes the position
+    """
     now = time.time()
     with get_connection() as conn:
-        existing = conn.execute(
-            "SELECT * FROM positions WHERE wallet_address = ? AND token_mint = ?",
-            (wallet_address, token_mint),
-        ).fetchone()
-
-        if existing:
-            old_qty = existing["quantity"]
-            old_avg = existing["average_entry_price"] or 0
-
-            new_qty = old_qty + quantity_delta
-
-            if quantity_delta > 0 and old_qty >= 0:
-                total_cost = (old_qty * old_avg) + (quantity_delta * price)
-                new_avg = total_cost / new_qty if new_qty > 0 else 0
-            elif quantity_delta < 0:
-                realized = abs(quantity_delta) * (price - old_avg)
-                conn.execute(
-                    "UPDATE positions SET realized_pnl = realized_pnl + ? WHERE position_id = ?",
-                    (realized, existing["position_id"]),
-                )
-                new_avg = old_avg
-            else:
-                new_avg = old_avg
-
-            if new_qty <= 0:
-                conn.execute(
-                    "UPDATE positions SET quantity = 0, closed_at = ?, current_price = ? WHERE position_id = ?",
-                    (now, price, existing["position_id"]),
-                )
-            else:
-                conn.execute(
-                    """UPDATE positions SET
-                       quantity = ?, average_entry_price = ?, current_price = ?
-                       WHERE position_id = ?""",
-                    (new_qty, new_avg, price, existing["position_id"]),
-                )
-        else:
-            position_id = str(uuid.uuid4())
-            conn.execute(
-                """INSERT INTO positions
-                   (position_id, wallet_address, token_mint, quantity,
-                    average_entry_price, current_price, opened_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (position_id, wallet_address, token_mint,
-                 max(0, quantity_delta), price, price, now),
-            )
+        conn.execute(
+            """INSERT INTO positions
+               (position_id, wallet_address, token_mint, quantity,
+                average_entry_price, current_price, opened_at)
+               VALUES (:position_id, :wallet_address, :token_mint, MAX(0, :delta),
+                       :price, :price, :now)
+               ON CONFLICT(wallet_address, token_mint) DO UPDATE SET
+                 quantity = CASE WHEN quantity + :delta <= 0 THEN 0
+                                 ELSE quantity + :delta END,
+                 average_entry_price = CASE
+                     WHEN quantity + :delta <= 0 THEN average_entry_price
+                     WHEN :delta > 0 AND quantity >= 0 THEN
+                         (quantity * COALESCE(average_entry_price, 0) + :delta * :price)
+                         / (quantity + :delta)
+                     ELSE COALESCE(average_entry_price, 0) END,
+                 realized_pnl = realized_pnl + CASE
+                     WHEN :delta < 0 THEN -:delta * (:price - COALESCE(average_entry_price, 0))
+                     ELSE 0 END,
+                 current_price = :price,
+                 closed_at = CASE WHEN quantity + :delta <= 0 THEN :now
+                                  ELSE closed_at END""",
+            {
+                "position_id": _new_id(),
+                "wallet_address": wallet_address,
+                "token_mint": token_mint,
+                "delta": quantity_delta,
+                "price": price,
+                "now": now,
+            },
+        )
 
 
 def get_open_positions() -> list:
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM positions WHERE quantity > 0 ORDER BY opened_at DESC"
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 def get_positions_by_wallet(wallet_address: str) -> list:
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             "SELECT * FROM positions WHERE wallet_address = ? AND quantity > 0",
             (wallet_address,),
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 # ── Transaction Operations ──────────────────────────────────────────
 
+_TRANSACTION_INSERT_SQL = """INSERT INTO transactions
+   (tx_signature, order_id, wallet_address, transaction_type,
+    amount_sol, fee_sol, status, block_slot, timestamp, raw_response)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
 def record_transaction(
     tx_signature: str,
     wallet_address: str,
@@ -323,10 +463,7 @@ def record_transaction(
     now = time.time()
     with get_connection() as conn:
         conn.execute(
-            """INSERT INTO transactions
-               (tx_signature, order_id, wallet_address, transaction_type,
-                amount_sol, fee_sol, status, block_slot, timestamp, raw_response)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            _TRANSACTION_INSERT_SQL,
             (tx_signature, order_id, wallet_address, transaction_type,
              amount_sol, fee_sol, status, block_slot, now, raw_response),
         )
@@ -342,6 +479,103 @@ def update_transaction_status(tx_signature: str, status: str, block_slot: int =
 
 # ── Audit Log ───────────────────────────────────────────────────────
 
+_AUDIT_INSERT_SQL = """INSERT INTO audit_log
+   (timestamp, event_type, actor, action, resource, outcome, metadata, correlation_id)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Append-only rows (audit events, price ticks, wallet/capital snapshots) are
+# queued and written in batches by a background thread, so callers never
+# wait on their commit. Orders and transactions stay synchronous because the
+# trade pipeline reads them back immediately.
+_WRITE_BATCH_MAX = 500
+_WRITE_FLUSH_INTERVAL_S = 0.02
+_write_queue: queue.SimpleQueue = queue.SimpleQueue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_dropped_writes = 0  # queued rows that could not be written even one at a time
+
+
+def _commit_rows(batch):
+    """Write (sql, params) rows in one transaction, one executemany per statement run."""
+    with get_connection() as conn:
+        for sql, group in itertools.groupby(batch, key=lambda item: item[0]):
+            conn.executemany(sql, [params for _, params in group])
+
+
+def _write_batch(batch: list):
+    """Commit a batch; if that fails, retry row by row so one bad row doesn't drop the rest."""
+    global _dropped_writes
+    try:
+        _commit_rows(batch)
+        return
+    except Exception as e:
+        logger.warning(f"Batch write of {len(batch)} queued row(s) failed, retrying row by row: {e}")
+
+    dropped = 0
+    last_error = None
+    for item in batch:
+        try:
+            _commit_rows((item,))
+        except Exception as e:
+            dropped += 1
+            last_error = e
+    if dropped:
+        _dropped_writes += dropped
+        logger.error(
+            f"Dropped {dropped}/{len(batch)} queued row(s) ({_dropped_writes} total): {last_error}"
+        )
+
+
+def get_dropped_write_count() -> int:
+    """Queued rows discarded since startup after their row-by-row retry failed."""
+    return _dropped_writes
+
+
+def _writer_loop():
+    """Drain the write queue: up to _WRITE_BATCH_MAX rows or _WRITE_FLUSH_INTERVAL_S per commit."""
+    while True:
+        batch = []
+        waiters = []
+        item = _write_queue.get()
+        deadline = time.monotonic() + _WRITE_FLUSH_INTERVAL_S
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)  # flush request — write what we have now
+                break
+            batch.append(item)
+            if len(batch) >= _WRITE_BATCH_MAX:
+                break
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = _write_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_batch(batch)
+        for waiter in waiters:
+            waiter.set()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(
+                target=_writer_loop, name="db-writer", daemon=True,
+            )
+            _writer.start()
+
+
+def _enqueue_write(sql: str, params: tuple):
+    _ensure_writer()
+    _write_queue.put((sql, params))
+
+
 def log_audit_event(
     event_type: str,
     actor: str,
@@ -351,79 +585,119 @@ def log_audit_event(
     metadata: dict = None,
     correlation_id: str = None,
 ):
-    """Immutable audit trail. Log everything."""
-    now = time.time()
-    with get_connection() as conn:
-        conn.execute(
-            """INSERT INTO audit_log
-               (timestamp, event_type, actor, action, resource, outcome, metadata, correlation_id)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (now, event_type, actor, action, resource, outcome,
-             json.dumps(metadata) if metadata else None, correlation_id),
-        )
+    """Immutable audit trail. Log everything. Non-blocking — rows are written in batches."""
+    _enqueue_write(
+        _AUDIT_INSERT_SQL,
+        (time.time(), event_type, actor, action, resource, outcome,
+         _dumps(metadata) if metadata else None, correlation_id),
+    )
+
+
+@atexit.register
+def flush_pending_writes(timeout_s: float = 5.0) -> bool:
+    """Block until every queued write is committed. Call on shutdown."""
+    if _writer is None or not _writer.is_alive():
+        return True
+    done = threading.Event()
+    _write_queue.put(done)
+    return done.wait(timeout_s)
+
+
+flush_audit_log = flush_pending_writes  # original name, kept for callers
 
 
 def get_audit_log(event_type: str = None, limit: int = 100) -> list:
     with get_connection() as conn:
         if event_type:
-            rows = conn.execute(
+            cur = conn.execute(
                 "SELECT * FROM audit_log WHERE event_type = ? ORDER BY timestamp DESC LIMIT ?",
                 (event_type, limit),
-            ).fetchall()
+            )
         else:
-            rows = conn.execute(
+            cur = conn.execute(
                 "SELECT * FROM audit_log ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ).fetchall()
-        return [dict(row) for row in rows]
+            )
+        return _rows_to_dicts(cur)
 
 
 # ── Price History ───────────────────────────────────────────────────
 
+_PRICE_INSERT_SQL = """INSERT INTO price_history (token_mint, price, volume_24h, liquidity, timestamp)
+   VALUES (?, ?, ?, ?, ?)"""
+
+
 def record_price(token_mint: str, price: float, volume_24h: float = None, liquidity: float = None):
-    now = time.time()
+    """Non-blocking — queued for the background writer."""
+    _enqueue_write(_PRICE_INSERT_SQL, (token_mint, price, volume_24h, liquidity, time.time()))
+
+
+def record_prices_bulk(rows: list):
+    """
+    Insert many price points in one transaction.
+    rows: iterable of (token_mint, price, volume_24h, liquidity, timestamp) tuples.
+    """
     with get_connection() as conn:
-        conn.execute(
-            """INSERT INTO price_history (token_mint, price, volume_24h, liquidity, timestamp)
-               VALUES (?, ?, ?, ?, ?)""",
-            (token_mint, price, volume_24h, liquidity, now),
-        )
+        conn.executemany(_PRICE_INSERT_SQL, rows)
 
 
 def get_price_history(token_mint: str, hours: int = 24) -> list:
     cutoff = time.time() - (hours * 3600)
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             """SELECT * FROM price_history
                WHERE token_mint = ? AND timestamp >= ?
                ORDER BY timestamp ASC""",
             (token_mint, cutoff),
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 # ── Wallet Snapshots ────────────────────────────────────────────────
 
+_WALLET_SNAPSHOT_INSERT_SQL = """INSERT INTO wallet_snapshots
+   (wallet_address, balance_sol, token_balances, total_value_sol, timestamp)
+   VALUES (?, ?, ?, ?, ?)"""
+
+
 def record_wallet_snapshot(wallet_address: str, balance_sol: float,
                            token_balances: dict = None, total_value_sol: float = None):
-    now = time.time()
-    with get_connection() as conn:
-        conn.execute(
-            """INSERT INTO wallet_snapshots
-               (wallet_address, balance_sol, token_balances, total_value_sol, timestamp)
-               VALUES (?, ?, ?, ?, ?)""",
-            (wallet_address, balance_sol,
-             json.dumps(token_balances) if token_balances else None,
-             total_value_sol, now),
-        )
+    """Non-blocking — queued for the background writer."""
+    _enqueue_write(
+        _WALLET_SNAPSHOT_INSERT_SQL,
+        (wallet_address, balance_sol,
+         _dumps(token_balances) if token_balances else None,
+         total_value_sol, time.time()),
+    )
 
 
 # ── Analytics Queries ───────────────────────────────────────────────
 
+# Aggregates full-scan orders, so dashboard polls share a short-lived result.
+# key -> (orders generation, computed_at, value)
+_STATS_CACHE_TTL_S = 5.0
+_stats_cache: dict = {}
+
+
+def _cached_stats(key, compute):
+    now = time.monotonic()
+    cached = _stats_cache.get(key)
+    if cached and cached[0] == _orders_generation and now - cached[1] < _STATS_CACHE_TTL_S:
+        return cached[2]
+    generation = _orders_generation
+    value = compute()
+    _stats_cache[key] = (generation, now, value)
+    return value
+
+
 def get_daily_pnl(days: int = 7) -> list:
-    """Get daily PnL summary."""
+    """Get daily PnL summary (cached for a few seconds)."""
+    return _cached_stats(("daily_pnl", days), lambda: _query_daily_pnl(days))
+
+
+def _query_daily_pnl(days: int) -> list:
     cutoff = time.time() - (days * 86400)
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             """SELECT
                  date(created_at, 'unixepoch') as date,
                  SUM(CASE WHEN side = 'buy' THEN quantity_sol ELSE 0 END) as total_buys,
@@ -434,12 +708,16 @@ def get_daily_pnl(days: int = 7) -> list:
                GROUP BY date(created_at, 'unixepoch')
                ORDER BY date DESC""",
             (cutoff,),
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
 
 
 def get_trade_stats() -> dict:
-    """Overall trading statistics."""
+    """Overall trading statistics (cached for a few seconds)."""
+    return _cached_stats("trade_stats", _query_trade_stats)
+
+
+def _query_trade_stats() -> dict:
     with get_connection() as conn:
         row = conn.execute(
             """SELECT
@@ -456,6 +734,12 @@ def get_trade_stats() -> dict:
 
 # ── Capital Snapshots ──────────────────────────────────────────────
 
+_CAPITAL_SNAPSHOT_INSERT_SQL = """INSERT INTO capital_snapshots
+   (total_budget_usd, deployed_capital_usd, available_capital_usd,
+    sol_usd_price, bonding_curve_phase, capital_utilization_pct, timestamp)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
 def record_capital_snapshot(
     total_budget_usd: float,
     deployed_capital_usd: float,
@@ -464,27 +748,22 @@ def record_capital_snapshot(
     bonding_curve_phase: str = None,
     capital_utilization_pct: float = None,
 ):
-    """Record a capital state snapshot for historical tracking."""
-    now = time.time()
-    with get_connection() as conn:
-        conn.execute(
-            """INSERT INTO capital_snapshots
-               (total_budget_usd, deployed_capital_usd, available_capital_usd,
-                sol_usd_price, bonding_curve_phase, capital_utilization_pct, timestamp)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (total_budget_usd, deployed_capital_usd, available_capital_usd,
-             sol_usd_price, bonding_curve_phase, capital_utilization_pct, now),
-        )
+    """Record a capital state snapshot for historical tracking (non-blocking)."""
+    _enqueue_write(
+        _CAPITAL_SNAPSHOT_INSERT_SQL,
+        (total_budget_usd, deployed_capital_usd, available_capital_usd,
+         sol_usd_price, bonding_curve_phase, capital_utilization_pct, time.time()),
+    )
 
 
 def get_capital_snapshots(hours: int = 24) -> list:
     """Get recent capital snapshots."""
     cutoff = time.time() - (hours * 3600)
     with get_connection() as conn:
-        rows = conn.execute(
+        cur = conn.execute(
             """SELECT * FROM capital_snapshots
                WHERE timestamp >= ?
                ORDER BY timestamp ASC""",
             (cutoff,),
-        ).fetchall()
-        return [dict(row) for row in rows]
+        )
+        return _rows_to_dicts(cur)
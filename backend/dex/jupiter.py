@@ -8,13 +8,25 @@ Jupiter V6 API: https://station.jup.ag/docs/apis/swap-api
 - Dynamic compute budget and priority fees
 """
 
+import sys
 import time
 import asyncio
 import logging
 import httpx
+import orjson
 from dataclasses import dataclass
 from typing import Optional
 
+try:
+    from pybase64 import b64decode  # SIMD-accelerated, same API
+except ImportError:
+    from base64 import b64decode
+
+try:
+    import ijson  # streaming parse for get_quote_lite
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger("dex.jupiter")
 
 # Jupiter API endpoints (migrated from deprecated v6 to current lite-api)
@@ -22,11 +34,31 @@ JUPITER_QUOTE_URL = "https://lite-api.jup.ag/swap/v1/quote"
 JUPITER_SWAP_URL = "https://lite-api.jup.ag/swap/v1/swap"
 JUPITER_PRICE_URL = "https://lite-api.jup.ag/price/v2"
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Quote flags that never change between calls
+_QUOTE_STATIC_PARAMS = {
+    "onlyDirectRoutes": "false",
+    "asLegacyTransaction": "false",
+}
+
+# Top-level scalar quote fields returned by get_quote_lite
+_QUOTE_LITE_FIELDS = frozenset({
+    "inputMint", "outputMint", "inAmount", "outAmount",
+    "priceImpactPct", "swapUsdValue", "error",
+})
+
+# How long a fetched USD price is served from cache (seconds)
+PRICE_CACHE_TTL_S = 5.0
+
+# dataclass(slots=True) needs Python 3.10; plain dataclasses on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # SOL mint address (native)
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SwapQuote:
     """Quote from Jupiter for a swap."""
     input_mint: str
@@ -36,9 +68,10 @@ class SwapQuote:
     price_impact_pct: float
     route_plan: list
     raw_quote: dict
+    raw_quote_bytes: bytes = b""  # response body as received, for re-sending verbatim
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SwapResult:
     """Result of an executed swap."""
     tx_signature: str
@@ -52,31 +85,89 @@ class SwapResult:
 
 
 class RateLimiter:
-    """Token bucket rate limiter for Jupiter API."""
+    """
+    Token bucket rate limiter for Jupiter API.
+
+    A background task adds one token every 1/max_per_second seconds while
+    the bucket is below `burst`, so acquire() only decrements (or waits on
+    the condition). The refill task stops once the bucket is full and is
+    restarted by the next acquire().
 
-    def __init__(self, max_per_second: float = 8, burst: int = 3):
+    The rate adapts to server feedback (AIMD): a 429 empties the bucket,
+    pauses refills for Retry-After and halves the rate; each successful
+    response adds `increase_step` back, up to `ceiling_per_second`.
+    """
+
+    def __init__(
+        self,
+        max_per_second: float = 8,
+        burst: int = 3,
+        min_per_second: float = 1.0,
+        ceiling_per_second: Optional[float] = None,
+        increase_step: float = 0.1,
+    ):
         self.max_per_second = max_per_second
         self.burst = burst
-        self._tokens = float(burst)
-        self._last_refill = time.time()
+        self.min_per_second = min_per_second
+        self.ceiling_per_second = ceiling_per_second or max_per_second
+        self.increase_step = increase_step
+        self._tokens = burst
+        self._paused_until = 0.0
+        self._cond = asyncio.Condition()
+        self._refill_task: Optional[asyncio.Task] = None
 
     async def acquire(self):
         """Wait until a request slot is available."""
-        while True:
-            now = time.time()
-            elapsed = now - self._last_refill
-            self._tokens = min(
-                self.burst,
-                self._tokens + elapsed * self.max_per_second,
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._tokens >= 1)
+            self._tokens -= 1
+            if self._refill_task is None or self._refill_task.done():
+                self._refill_task = asyncio.create_task(self._refill_loop())
+
+    async def _refill_loop(self):
+        while self._tokens < self.burst:
+            pause = self._paused_until - time.monotonic()
+            await asyncio.sleep(max(1.0 / self.max_per_second, pause))
+            async with self._cond:
+                self._tokens += 1
+                self._cond.notify()
+
+    async def penalize(self, retry_after: float):
+        """Back off after a 429: drain the bucket, pause refills, halve the rate."""
+        async with self._cond:
+            self._tokens = 0
+            self._paused_until = time.monotonic() + retry_after
+            self.max_per_second = max(self.min_per_second, self.max_per_second / 2)
+            # Restart refills so an in-progress sleep can't hand out a token early
+            if self._refill_task is not None:
+                self._refill_task.cancel()
+            self._refill_task = asyncio.create_task(self._refill_loop())
+        logger.warning(
+            f"Jupiter rate limited: pausing {retry_after:.1f}s, "
+            f"rate now {self.max_per_second:.1f}/s"
+        )
+
+    def credit(self):
+        """Record a successful response; probe the rate back up toward the ceiling."""
+        if self.max_per_second < self.ceiling_per_second:
+            self.max_per_second = min(
+                self.ceiling_per_second,
+                self.max_per_second + self.increase_step,
             )
-            self._last_refill = now
 
-            if self._tokens >= 1:
-                self._tokens -= 1
-                return
-            else:
-                wait_time = (1 - self._tokens) / self.max_per_second
-                await asyncio.sleep(wait_time)
+    def close(self):
+        """Stop the refill task (pending waiters stay blocked)."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+
+
+def _retry_after_seconds(response: httpx.Response, default: float = 1.0) -> float:
+    """Seconds to wait from a Retry-After header; HTTP-date values fall back to `default`."""
+    try:
+        return max(0.0, float(response.headers.get("retry-after", default)))
+    except ValueError:
+        return default
 
 
 class JupiterAdapter:
@@ -93,22 +184,107 @@ class JupiterAdapter:
         self.default_slippage_bps = default_slippage_bps
         self.priority_fee_lamports = priority_fee_lamports
         self._rate_limiter = RateLimiter()
-        self._client: Optional[httpx.AsyncClient] = None
+        # Per-call quote params start from a copy of this; only mints, amount
+        # and a non-default slippage are filled in
+        self._quote_params_tmpl = {
+            **_QUOTE_STATIC_PARAMS,
+            "slippageBps": default_slippage_bps,
+        }
+        self._quote_url = httpx.URL(JUPITER_QUOTE_URL)  # parsed once
+        # token_mint -> (price_usd, monotonic expiry); in-flight fetches are
+        # shared so concurrent callers for one mint make a single request
+        self._price_cache: dict[str, tuple[float, float]] = {}
+        self._price_inflight: dict[str, asyncio.Task] = {}
+        self._sol_price_cache: dict[str, tuple[float, float]] = {}  # same, tokens per SOL
+        self._sol_price_inflight: dict[str, asyncio.Task] = {}
+        # One pooled keep-alive client for the adapter's lifetime — every call
+        # goes to the same host, so reusing TCP+TLS sessions is the big win
+        self._client: httpx.AsyncClient = self._new_client()
+
+    @staticmethod
+    def _new_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=2.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,  # survive idle gaps between trading cycles
+            ),
+            headers={"accept-encoding": "gzip"},
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
+        if self._client.is_closed:
+            self._client = self._new_client()
         return self._client
 
     async def close(self):
-        if self._client and not self._client.is_closed:
+        self._rate_limiter.close()
+        if not self._client.is_closed:
             await self._client.aclose()
 
+    async def _record_response(self, response: httpx.Response) -> None:
+        """Feed a response status back into the adaptive rate limiter."""
+        if response.status_code == 429:
+            await self._rate_limiter.penalize(_retry_after_seconds(response))
+        elif response.status_code < 400:
+            self._rate_limiter.credit()
+
+    async def warmup(self) -> None:
+        """Open a connection ahead of the first real request (DNS + TCP + TLS)."""
+        await self._rate_limiter.acquire()
+        client = await self._get_client()
+        try:
+            response = await client.get(JUPITER_PRICE_URL, params={"ids": SOL_MINT}, timeout=5.0)
+            await self._record_response(response)
+            logger.info("Jupiter connection pool warmed up")
+        except Exception as e:
+            logger.warning(f"Jupiter warmup failed (will connect on first request): {e}")
+
+    async def __aenter__(self) -> "JupiterAdapter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     # ── Price Queries ───────────────────────────────────────────────
 
     async def get_price(self, token_mint: str) -> Optional[float]:
         """Get current token price in USD from Jupiter.
 
+        Prices are cached for PRICE_CACHE_TTL_S, and concurrent lookups of
+        the same mint share one in-flight request.
+        """
+        return await self._cached_lookup(
+            self._price_cache, self._price_inflight, token_mint,
+            PRICE_CACHE_TTL_S, self._fetch_price,
+        )
+
+    @staticmethod
+    async def _cached_lookup(cache: dict, inflight: dict, key: str, ttl: float, fetch):
+        """TTL cache in front of `fetch(key)`; concurrent misses share one call."""
+        cached = cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        task = inflight.get(key)
+        if task is None:
+            async def fetch_and_cache():
+                value = await fetch(key)
+                if value is not None:
+                    cache[key] = (value, time.monotonic() + ttl)
+                return value
+
+            task = asyncio.ensure_future(fetch_and_cache())
+            inflight[key] = task
+            task.add_done_callback(lambda _t: inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't abort the fetch for the rest
+        return await asyncio.shield(task)
+
+    async def _fetch_price(self, token_mint: str) -> Optional[float]:
+        """Fetch a USD price from the network.
+
         Tries the price API first, falls back to deriving price from a
         small quote (the v2 price API may require authentication).
         """
@@ -121,25 +297,26 @@ class JupiterAdapter:
                 JUPITER_PRICE_URL,
                 params={"ids": token_mint},
             )
+            await self._record_response(response)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if "data" in data and token_mint in data["data"]:
                     return data["data"][token_mint]["price"]
         except Exception as e:
-            logger.debug(f"Price API unavailable for {token_mint[:8]}...: {e}")
+            logger.debug("Price API unavailable for %s...: %s", token_mint[:8], e)
 
         # Fallback: derive price from a small quote (1 SOL -> token)
         try:
-            quote = await self.get_quote(
+            quote = await self.get_quote_lite(
                 input_mint=SOL_MINT,
                 output_mint=token_mint,
                 amount=1_000_000_000,  # 1 SOL in lamports
             )
-            if quote and quote.raw_quote.get("swapUsdValue"):
+            if quote and quote.get("swapUsdValue"):
                 # swapUsdValue is the USD value of the input (1 SOL)
-                sol_usd = float(quote.raw_quote["swapUsdValue"])
+                sol_usd = float(quote["swapUsdValue"])
                 # Price per token = SOL_USD_price / tokens_per_SOL
-                tokens_per_sol = quote.output_amount / (10 ** 6)  # assuming 6 decimals
+                tokens_per_sol = int(quote["outAmount"]) / (10 ** 6)  # assuming 6 decimals
                 if tokens_per_sol > 0:
                     price_usd = sol_usd / tokens_per_sol
                     return price_usd
@@ -159,6 +336,17 @@ class JupiterAdapter:
             return quote.output_amount
         return None
 
+    async def get_price_in_sol_cached(self, token_mint: str, ttl: float = 1.0) -> Optional[float]:
+        """get_price_in_sol() for 1 SOL, cached per mint for `ttl` seconds.
+
+        For polled readers (e.g. take-profit status); concurrent lookups of
+        the same mint share one quote request.
+        """
+        return await self._cached_lookup(
+            self._sol_price_cache, self._sol_price_inflight, token_mint,
+            ttl, self.get_price_in_sol,
+        )
+
     # ── Quoting ─────────────────────────────────────────────────────
 
     async def get_quote(
@@ -166,25 +354,32 @@ class JupiterAdapter:
         input_mint: str,
         output_mint: str,
         amount: int,
-        slippage_bps: int = None,
+        slippage_bps: Optional[int] = None,
     ) -> Optional[SwapQuote]:
-        """Get a swap quote from Jupiter."""
+        """Get a swap quote from Jupiter.
+
+        slippage_bps=None uses the adapter default; 0 is passed through as a
+        zero-slippage quote rather than falling back to the default.
+        """
+        params = self._quote_params_tmpl.copy()
+        params["inputMint"] = input_mint
+        params["outputMint"] = output_mint
+        params["amount"] = str(amount)
+        if slippage_bps is not None:
+            params["slippageBps"] = slippage_bps
+        return await self._request_quote(params)
+
+    async def _request_quote(self, params: dict) -> Optional[SwapQuote]:
         await self._rate_limiter.acquire()
         client = await self._get_client()
 
-        params = {
-            "inputMint": input_mint,
-            "outputMint": output_mint,
-            "amount": str(amount),
-            "slippageBps": slippage_bps or self.default_slippage_bps,
-            "onlyDirectRoutes": "false",
-            "asLegacyTransaction": "false",
-        }
-
         try:
-            response = await client.get(JUPITER_QUOTE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+            response = await client.get(self._quote_url, params=params)
+            await self._record_response(response)
+            if response.status_code >= 400:
+                logger.error(f"Jupiter quote HTTP error: {response.status_code}")
+                return None
+            data = orjson.loads(response.content)
 
             if "error" in data:
                 logger.error(f"Jupiter quote error: {data['error']}")
@@ -198,11 +393,66 @@ class JupiterAdapter:
                 price_impact_pct=float(data.get("priceImpactPct", 0)),
                 route_plan=data.get("routePlan", []),
                 raw_quote=data,
+                raw_quote_bytes=response.content,
             )
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Jupiter quote HTTP error: {e.response.status_code}")
+        except Exception as e:
+            logger.error(f"Jupiter quote failed: {e}")
             return None
+
+    async def get_quote_lite(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: Optional[int] = None,
+    ) -> Optional[dict]:
+        """Get only the top-level scalar fields of a quote (no routePlan).
+
+        For callers that just need amounts or swapUsdValue. With ijson
+        installed the body is parsed as it streams in and the route plan is
+        never materialized; otherwise the full body is parsed and trimmed.
+        """
+        await self._rate_limiter.acquire()
+        client = await self._get_client()
+
+        params = self._quote_params_tmpl.copy()
+        params["inputMint"] = input_mint
+        params["outputMint"] = output_mint
+        params["amount"] = str(amount)
+        if slippage_bps is not None:
+            params["slippageBps"] = slippage_bps
+
+        try:
+            async with client.stream("GET", self._quote_url, params=params) as response:
+                await self._record_response(response)
+                if response.status_code >= 400:
+                    logger.error(f"Jupiter quote HTTP error: {response.status_code}")
+                    return None
+
+                if ijson is not None:
+                    fields = {}
+                    events = ijson.sendable_list()
+                    parser = ijson.parse_coro(events)
+                    async for chunk in response.aiter_bytes():
+                        parser.send(chunk)
+                        for prefix, event, value in events:
+                            if prefix in _QUOTE_LITE_FIELDS and event in ("string", "number"):
+                                fields[prefix] = value
+                        del events[:]
+                    parser.close()
+                else:
+                    data = orjson.loads(await response.aread())
+                    fields = {k: data[k] for k in _QUOTE_LITE_FIELDS if k in data}
+
+            if "error" in fields:
+                logger.error(f"Jupiter quote error: {fields['error']}")
+                return None
+            if "outAmount" not in fields:
+                logger.error("Jupiter quote missing outAmount")
+                return None
+            return fields
+
         except Exception as e:
             logger.error(f"Jupiter quote failed: {e}")
             return None
@@ -219,22 +469,30 @@ class JupiterAdapter:
         await self._rate_limiter.acquire()
         client = await self._get_client()
 
-        payload = {
-            "quoteResponse": quote.raw_quote,
+        # Splice the quote body in as received instead of re-encoding the dict
+        quote_json = quote.raw_quote_bytes or orjson.dumps(quote.raw_quote)
+        rest = orjson.dumps({
             "userPublicKey": user_public_key,
             "wrapAndUnwrapSol": wrap_unwrap_sol,
             "dynamicComputeUnitLimit": True,
             "prioritizationFeeLamports": self.priority_fee_lamports,
-        }
+        })
+        body = b'{"quoteResponse":' + quote_json + b"," + rest[1:]
 
         try:
-            response = await client.post(JUPITER_SWAP_URL, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            response = await client.post(
+                JUPITER_SWAP_URL,
+                content=body,
+                headers=_JSON_HEADERS,
+            )
+            await self._record_response(response)
+            if response.status_code >= 400:
+                logger.error(f"Jupiter swap HTTP error: {response.status_code}")
+                return None
+            data = orjson.loads(response.content)
 
             if "swapTransaction" in data:
-                import base64
-                return base64.b64decode(data["swapTransaction"])
+                return b64decode(data["swapTransaction"])
             else:
                 logger.error(f"No swap transaction in response: {data}")
                 return None
@@ -260,6 +518,9 @@ class JupiterAdapter:
         amount_lamports = int(amount_sol * 1_000_000_000)
         slippage_bps = int(max_slippage * 100)
 
+        if amount_lamports <= 0:
+            raise Exception(f"Swap amount too small: {amount_sol} SOL")
+
         if side == "buy":
             input_mint = SOL_MINT
             output_mint = token_mint
@@ -277,6 +538,8 @@ class JupiterAdapter:
 
         if not quote:
             raise Exception("Failed to get swap quote from Jupiter")
+        if quote.output_amount <= 0:
+            raise Exception("Jupiter quote has no output amount")
 
         # 2. Check price impact
         if quote.price_impact_pct > max_slippage:
@@ -285,12 +548,12 @@ class JupiterAdapter:
                 f"(max: {max_slippage}%)"
             )
 
-        logger.info(
-            f"Quote: {side} {amount_sol} SOL → "
-            f"output={quote.output_amount} "
-            f"impact={quote.price_impact_pct:.3f}% "
-            f"routes={len(quote.route_plan)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Quote: %s %s SOL → output=%d impact=%.3f%% routes=%d",
+                side, amount_sol, quote.output_amount,
+                quote.price_impact_pct, len(quote.route_plan),
+            )
 
         # 3. Build transaction
         tx_bytes = await self.build_swap_transaction(
@@ -310,11 +573,11 @@ class JupiterAdapter:
         if not tx_signature:
             raise Exception("Transaction signing/sending failed")
 
-        # 5. Calculate fill price
+        # 5. Calculate fill price (both amounts validated > 0 above)
         if side == "buy":
-            fill_price = amount_lamports / quote.output_amount if quote.output_amount > 0 else 0
+            fill_price = amount_lamports / quote.output_amount
         else:
-            fill_price = quote.output_amount / amount_lamports if amount_lamports > 0 else 0
+            fill_price = quote.output_amount / amount_lamports
 
         return {
             "tx_signature": tx_signature,
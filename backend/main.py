@@ -19,38 +19,52 @@ v1 endpoints (/api/status, /api/marketmaker/start, etc.) still work for the exis
 """
 
 import os
+import hmac
+import atexit
+import time
 import json
 import asyncio
+import orjson
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import NamedTuple, Optional
 
 from dotenv import load_dotenv
 load_dotenv()
 
+from solana.rpc.async_api import AsyncClient
+from solders.keypair import Keypair
+from solders.transaction import VersionedTransaction
+
 # Import all v2 layers
-from backend.auth import AuthMiddleware, load_api_key_from_env, get_bind_host
+from backend.auth import AuthMiddleware, load_api_key_from_env, get_bind_host, rate_limiter
 from backend.risk_manager import RiskManager, RiskRules, TradeIntent
 from backend.order_manager import OrderManager
 from backend.database import (
     init_database, get_recent_orders, get_open_positions,
-    get_audit_log, get_trade_stats, get_daily_pnl,
+    get_audit_log, get_trade_stats, get_daily_pnl, flush_pending_writes,
+    run_wal_checkpointer,
 )
 from backend.wallet_manager import (
     EncryptedKeyStore, WalletOrchestrator, WalletRole, SelectionStrategy,
 )
 from backend.strategy.wyckoff import WyckoffDetector
 from backend.profit_taker import ProfitTaker
+from backend.take_profit_book import TakeProfitBook
 from backend.dex.jupiter import JupiterAdapter
 from backend.market_maker_v2 import MarketMakerV2, TradingConfig
 from backend.config import settings
 from backend.capital_brain import CapitalBrain
 from backend.trade_size_calculator import TradeSizeCalculator
+from backend.utils._b58 import b58decode, b58encode
 from backend.phase_config import (
     BondingCurvePhase, PhaseConfig, DEFAULT_PHASE_CONFIGS, get_phase_config,
 )
@@ -59,45 +73,104 @@ from backend.phase_config import (
 
 os.makedirs("data", exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("data/market_maker.log"),
-    ],
-)
+# Loggers only enqueue records; the console/file handlers run on the
+# listener's thread so a log write never blocks the loop. The listener starts
+# here, not in lifespan, so records from import time, the CLI and scripts
+# are written too; atexit drains it.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_formatter = logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler("data/market_maker.log"),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # layout is applied by _log_handlers
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("main")
 
+# ── Environment ─────────────────────────────────────────────────────
+
+class _EnvCache(NamedTuple):
+    """Environment overrides read by request handlers; they don't change at runtime."""
+    rpc_url: str
+    solana_network: str
+    keystore_passphrase: str
+    token_mint: str
+    mm_port: int
+
+
+def _read_port() -> int:
+    raw = os.getenv("MM_PORT")
+    if raw is None:
+        return settings.api_port
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Invalid MM_PORT={raw!r}, falling back to {settings.api_port}")
+        return settings.api_port
+
+
+def _read_env() -> _EnvCache:
+    return _EnvCache(
+        rpc_url=os.getenv("RPC_URL", settings.rpc_url),
+        solana_network=os.getenv("SOLANA_NETWORK", settings.solana_network),
+        keystore_passphrase=os.getenv("MM_KEYSTORE_PASSPHRASE", "change-this-in-production"),
+        token_mint=os.getenv("TOKEN_MINT", ""),
+        mm_port=_read_port(),
+    )
+
+
+ENV = _read_env()  # after load_dotenv() above
+_KEYSTORE_PASSPHRASE_BYTES = ENV.keystore_passphrase.encode()  # for constant-time compares
+
 # ── Global State ────────────────────────────────────────────────────
 
 market_maker: Optional[MarketMakerV2] = None
 mm_task: Optional[asyncio.Task] = None
 jupiter: Optional[JupiterAdapter] = None
+solana_client: Optional[AsyncClient] = None
 capital_brain: Optional[CapitalBrain] = None
 trade_calculator: Optional[TradeSizeCalculator] = None
 risk_manager: Optional[RiskManager] = None
 wallet_orchestrator: Optional[WalletOrchestrator] = None
 profit_taker = ProfitTaker()
+status_hub: Optional["StatusHub"] = None
 current_phase: BondingCurvePhase = BondingCurvePhase.STEALTH_ACCUMULATION
 
-# Take profit targets: wallet_address -> {token_mint, profit_percentage, initial_price, auto_sell}
-take_profit_targets: dict[str, dict] = {}
+# Take profit targets, one per wallet: token_mint, profit_percentage, initial_price, auto_sell
+take_profit_targets = TakeProfitBook()
 
 
 # ── App Lifecycle ───────────────────────────────────────────────────
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global jupiter, capital_brain, trade_calculator, risk_manager, wallet_orchestrator
+    global jupiter, solana_client, capital_brain, trade_calculator, risk_manager, wallet_orchestrator
+    global status_hub
 
     # Startup
     os.makedirs("data", exist_ok=True)
     init_database()
     load_api_key_from_env()
+    rate_limit_sweeper = asyncio.create_task(rate_limiter.run_sweeper())
+    wal_checkpointer = asyncio.create_task(run_wal_checkpointer())
+
+    status_hub = StatusHub()
+    status_producer = asyncio.create_task(_status_producer())
 
-    # Initialize Jupiter adapter (used by Capital Brain for SOL/USD price)
+    # Initialize Jupiter adapter — shared by Capital Brain, the market maker
+    # and the wallet endpoints so they all reuse one connection pool
     jupiter = JupiterAdapter()
+    await jupiter.warmup()
+
+    # Shared Solana RPC client (sends + balance refreshes reuse its connection)
+    solana_client = AsyncClient(ENV.rpc_url, timeout=10)
 
     # Initialize Capital Brain
     total_budget = float(os.getenv("TOTAL_BUDGET_USD", str(settings.total_budget_usd)))
@@ -106,20 +179,21 @@ async def lifespan(app: FastAPI):
         total_budget_usd=total_budget,
         jupiter=jupiter,
         cache_ttl_s=cache_ttl,
+        on_change=status_hub.notify,
     )
 
     # Initialize Trade Size Calculator
     trade_calculator = TradeSizeCalculator(capital_brain)
 
     # Initialize Risk Manager with Capital Brain
-    risk_manager = RiskManager(capital_brain=capital_brain)
+    risk_manager = RiskManager(capital_brain=capital_brain, on_change=status_hub.notify)
 
     # Apply phase-specific risk rules
     phase_config = get_phase_config(current_phase)
     risk_manager.update_from_phase_config(phase_config)
 
     # Initialize encrypted keystore
-    passphrase = os.getenv("MM_KEYSTORE_PASSPHRASE", "change-this-in-production")
+    passphrase = ENV.keystore_passphrase
     keystore = EncryptedKeyStore(passphrase)
     wallet_orchestrator = WalletOrchestrator(keystore)
 
@@ -138,6 +212,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if market_maker:
         market_maker.stop()
+    rate_limit_sweeper.cancel()
+    wal_checkpointer.cancel()
+    status_producer.cancel()
+    await jupiter.close()
+    await solana_client.close()
+    flush_pending_writes()
     logger.info("Server shutting down")
 
 
@@ -148,8 +228,7 @@ def _auto_import_legacy_wallet(keystore: EncryptedKeyStore, orchestrator: Wallet
         return
 
     try:
-        with open(wallet_path, 'r') as f:
-            key_data = json.load(f)
+        key_data = orjson.loads(wallet_path.read_bytes())
 
         if isinstance(key_data, list):
             key_bytes = bytes(key_data)
@@ -157,15 +236,13 @@ def _auto_import_legacy_wallet(keystore: EncryptedKeyStore, orchestrator: Wallet
             secret_key = key_data.get('secretKey') or key_data.get('privateKey')
             if secret_key:
                 if isinstance(secret_key, str):
-                    import base58
-                    key_bytes = base58.b58decode(secret_key)
+                    key_bytes = b58decode(secret_key)
                 else:
                     key_bytes = bytes(secret_key)
             else:
                 return
 
         # Derive public key from the keypair bytes
-        from solders.keypair import Keypair
         if len(key_bytes) == 64:
             keypair = Keypair.from_bytes(key_bytes)
         elif len(key_bytes) == 32:
@@ -203,6 +280,7 @@ app = FastAPI(
     title="Solana Market Maker",
     description="Automated market maker with percentage-based capital allocation, Wyckoff strategy, and Jupiter DEX",
     version="2.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -226,19 +304,24 @@ app.add_middleware(
 # v2 Pydantic Models
 # ══════════════════════════════════════════════════════════════════════
 
-class StartRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: unknown fields are rejected and bodies are immutable."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class StartRequest(RequestModel):
     token_mint: str
     phase: Optional[str] = None  # Optional bonding curve phase override
 
 
-class WalletRegisterRequest(BaseModel):
+class WalletRegisterRequest(RequestModel):
     address: str
     private_key_hex: str  # Encrypted immediately on receipt
     role: str = "trading"
     label: str = ""
 
 
-class RiskRulesUpdate(BaseModel):
+class RiskRulesUpdate(RequestModel):
     max_position_per_wallet_pct: Optional[float] = None
     max_exposure_per_token_pct: Optional[float] = None
     total_max_exposure_pct: Optional[float] = None
@@ -249,50 +332,50 @@ class RiskRulesUpdate(BaseModel):
     stop_loss_percent: Optional[float] = None
 
 
-class TradingConfigUpdate(BaseModel):
+class TradingConfigUpdate(RequestModel):
     min_confidence: Optional[float] = None
 
 
-class BudgetUpdate(BaseModel):
+class BudgetUpdate(RequestModel):
     total_budget_usd: float
 
 
-class PhaseSetRequest(BaseModel):
+class PhaseSetRequest(RequestModel):
     phase: str  # "stealth_accumulation", "stabilization", "graduation_push"
 
 
-class ProfitTargetRequest(BaseModel):
+class ProfitTargetRequest(RequestModel):
     targets: list[dict]
 
 
-class TWAPRequest(BaseModel):
+class TWAPRequest(RequestModel):
     total_amount: float
     duration_hours: float
     num_steps: Optional[int] = None
 
 
 # Legacy v1 models
-class MarketMakerConfig(BaseModel):
+class MarketMakerConfig(RequestModel):
     spread_percentage: Optional[float] = None
     order_size: Optional[float] = None
     min_balance: Optional[float] = None
 
-class WalletImportRequest(BaseModel):
+class WalletImportRequest(RequestModel):
     private_key: str
 
 
-class ActiveWalletsRequest(BaseModel):
+class ActiveWalletsRequest(RequestModel):
     addresses: list[str]
 
 
-class WalletTradeRequest(BaseModel):
+class WalletTradeRequest(RequestModel):
     token_mint: str
     side: str  # "buy" or "sell"
     percentage: float = 5.0  # Percentage of wallet balance to use
     max_slippage: float = 2.0
 
 
-class TakeProfitRequest(BaseModel):
+class TakeProfitRequest(RequestModel):
     wallet_address: str
     token_mint: str
     profit_percentage: float  # Take profit when token value increases by this %
@@ -342,10 +425,14 @@ async def start_market_maker_v2(req: StartRequest):
         trade_calculator=trade_calculator,
         risk_manager=risk_manager,
         profit_taker=profit_taker,
+        jupiter=jupiter,
+        rpc_client=solana_client,
         initial_phase=current_phase,
+        on_change=status_hub.notify,
     )
 
     mm_task = asyncio.create_task(market_maker.start())
+    status_hub.notify()
     return {
         "status": "started",
         "token_mint": req.token_mint,
@@ -361,6 +448,7 @@ async def stop_market_maker_v2():
         market_maker.stop()
         if mm_task:
             mm_task.cancel()
+        status_hub.notify()
         return {"status": "stopped"}
     raise HTTPException(400, "Market maker not running")
 
@@ -417,6 +505,7 @@ async def update_budget(req: BudgetUpdate):
         market_maker.capital_brain.total_budget_usd = req.total_budget_usd
 
     logger.info(f"Budget updated: ${old_budget:.0f} -> ${req.total_budget_usd:.0f}")
+    status_hub.notify()
 
     return {
         "status": "updated",
@@ -470,6 +559,7 @@ async def set_phase(req: PhaseSetRequest):
         risk_manager.update_from_phase_config(phase_config)
 
     logger.info(f"Phase changed: {old_phase.value} -> {new_phase.value}")
+    status_hub.notify()
 
     result = {
         "status": "updated",
@@ -502,6 +592,9 @@ async def get_all_phase_configs():
 
 # ── Wallet Management ──────────────────────────────────────────────
 
+_WALLET_ROLE_VALUES = frozenset(r.value for r in WalletRole)
+
+
 @app.post("/api/v2/wallets/register")
 async def register_wallet(req: WalletRegisterRequest):
     if not wallet_orchestrator:
@@ -513,7 +606,7 @@ async def register_wallet(req: WalletRegisterRequest):
             req.address, key_bytes, label=req.label
         )
 
-        role = WalletRole(req.role) if req.role in [r.value for r in WalletRole] else WalletRole.TRADING
+        role = WalletRole(req.role) if req.role in _WALLET_ROLE_VALUES else WalletRole.TRADING
         info = wallet_orchestrator.register_wallet(req.address, role=role, label=req.label)
 
         return {"status": "registered", "wallet": info.to_dict()}
@@ -528,6 +621,16 @@ async def list_wallets():
     return wallet_orchestrator.get_pool_status()
 
 
+@app.get("/api/v2/wallets/stream")
+async def stream_wallets():
+    """Wallet pool as NDJSON (one wallet per line), encoded as it is sent."""
+    wallets = wallet_orchestrator.iter_wallets() if wallet_orchestrator else iter(())
+    return StreamingResponse(
+        (orjson.dumps(w) + b"\n" for w in wallets),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.post("/api/v2/wallets/reset")
 @app.post("/api/v2/wallets/reset-all")
 async def reset_all_wallets():
@@ -536,6 +639,7 @@ async def reset_all_wallets():
         raise HTTPException(500, "Wallet orchestrator not initialized")
     count = wallet_orchestrator.clear_all()
     take_profit_targets.clear()
+    _reconcile_capital()
     return {"status": "reset", "wallets_removed": count}
 
 
@@ -562,8 +666,8 @@ async def delete_wallet(address: str):
     removed = wallet_orchestrator.remove_wallet(address)
     if not removed:
         raise HTTPException(404, f"Wallet {address} not found")
-    if address in take_profit_targets:
-        del take_profit_targets[address]
+    take_profit_targets.remove(address)
+    _reconcile_capital()
     return {"status": "deleted", "address": address}
 
 
@@ -619,47 +723,30 @@ async def wallet_trade(address: str, req: WalletTradeRequest):
     if trade_amount_sol < 0.01:
         raise HTTPException(400, f"Insufficient balance for {req.percentage}% trade")
 
-    # Get signing key
-    signing_key = wallet_orchestrator.get_signing_key(address)
-    if not signing_key:
+    # Get signing keypair (built once per wallet and cached by the orchestrator)
+    try:
+        keypair = wallet_orchestrator.get_keypair(address)
+    except ValueError as e:
+        raise HTTPException(500, f"Trade execution failed: {e}")
+    if keypair is None:
         raise HTTPException(500, "Failed to get wallet signing key")
 
-    # Initialize Jupiter adapter
-    jup = JupiterAdapter()
-
     # Execute swap
     try:
-        from solana.rpc.async_api import AsyncClient
-        from solders.keypair import Keypair
-        from solders.transaction import VersionedTransaction
-
-        # Create keypair from signing key
-        if len(signing_key) == 64:
-            keypair = Keypair.from_bytes(signing_key)
-        elif len(signing_key) == 32:
-            keypair = Keypair.from_seed(signing_key)
-        else:
-            raise Exception(f"Invalid key length: {len(signing_key)}")
-
         wallet_pubkey = str(keypair.pubkey())
 
         async def sign_and_send(tx_bytes: bytes) -> str:
             """Sign and send transaction."""
-            from solana.rpc.async_api import AsyncClient
-            from solders.transaction import VersionedTransaction
-
             # Deserialize transaction
             unsigned_tx = VersionedTransaction.from_bytes(tx_bytes)
             # Sign it
             signed_tx = VersionedTransaction(unsigned_tx.message, [keypair])
 
             # Send to Solana
-            rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-            async with AsyncClient(rpc_url) as client:
-                result = await client.send_transaction(signed_tx)
-                return str(result.value) if result.value else ""
+            result = await solana_client.send_transaction(signed_tx)
+            return str(result.value) if result.value else ""
 
-        result = await jup.execute_swap(
+        result = await jupiter.execute_swap(
             wallet_address=wallet_pubkey,
             token_mint=req.token_mint,
             side=req.side,
@@ -669,8 +756,8 @@ async def wallet_trade(address: str, req: WalletTradeRequest):
         )
 
         # Update wallet balance
-        rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-        await wallet_orchestrator.refresh_balances(rpc_url)
+        await wallet_orchestrator.refresh_balances(client=solana_client)
+        _reconcile_capital()
 
         return {
             "status": "success",
@@ -696,20 +783,19 @@ async def set_take_profit(address: str, req: TakeProfitRequest):
         raise HTTPException(404, f"Wallet {address} not found")
 
     # Get current token price from Jupiter
-    jup = JupiterAdapter()
-    current_price = await jup.get_price_in_sol(req.token_mint)
+    current_price = await jupiter.get_price_in_sol_cached(req.token_mint)
 
     if current_price is None:
         raise HTTPException(400, "Failed to get token price from Jupiter")
 
     # Store take profit target
-    take_profit_targets[address] = {
-        "token_mint": req.token_mint,
-        "profit_percentage": req.profit_percentage,
-        "initial_price": current_price,
-        "auto_sell": req.auto_sell,
-        "target_price": current_price * (1 + req.profit_percentage / 100.0),
-    }
+    target = take_profit_targets.set(
+        address,
+        token_mint=req.token_mint,
+        profit_percentage=req.profit_percentage,
+        initial_price=current_price,
+        auto_sell=req.auto_sell,
+    )
 
     logger.info(f"Take profit set for {address[:8]}...: {req.profit_percentage}% target")
 
@@ -718,7 +804,7 @@ async def set_take_profit(address: str, req: TakeProfitRequest):
         "wallet": address,
         "token_mint": req.token_mint,
         "initial_price": current_price,
-        "target_price": take_profit_targets[address]["target_price"],
+        "target_price": target["target_price"],
         "profit_percentage": req.profit_percentage,
     }
 
@@ -731,8 +817,7 @@ async def get_take_profit(address: str):
         return {"status": "not_set"}
 
     # Get current price
-    jup = JupiterAdapter()
-    current_price = await jup.get_price_in_sol(target["token_mint"])
+    current_price = await jupiter.get_price_in_sol_cached(target["token_mint"])
 
     if current_price is None:
         current_price = target["initial_price"]
@@ -756,8 +841,7 @@ async def get_take_profit(address: str):
 @app.delete("/api/v2/wallets/{address}/take-profit")
 async def remove_take_profit(address: str):
     """Remove take profit target for a wallet."""
-    if address in take_profit_targets:
-        del take_profit_targets[address]
+    if take_profit_targets.remove(address):
         logger.info(f"Take profit removed for {address[:8]}...")
         return {"status": "removed"}
     return {"status": "not_found"}
@@ -776,7 +860,7 @@ async def get_risk_status():
 async def update_risk_rules(rules: RiskRulesUpdate):
     if not risk_manager:
         raise HTTPException(500, "Risk manager not initialized")
-    updates = {k: v for k, v in rules.model_dump().items() if v is not None}
+    updates = rules.model_dump(exclude_none=True)
     risk_manager.update_rules(**updates)
     return {"status": "updated", "rules": updates}
 
@@ -787,6 +871,7 @@ async def emergency_shutdown():
         risk_manager.emergency_shutdown()
     if market_maker:
         market_maker.stop()
+    status_hub.notify()
     return {"status": "emergency_shutdown_activated"}
 
 
@@ -801,6 +886,7 @@ async def reset_emergency():
 async def reset_circuit_breaker():
     if risk_manager:
         risk_manager.circuit_breaker.reset()
+    status_hub.notify()
     return {"status": "circuit_breaker_reset"}
 
 
@@ -835,7 +921,7 @@ async def get_trading_config():
 
 @app.put("/api/v2/trading/config")
 async def update_trading_config(cfg: TradingConfigUpdate):
-    updates = {k: v for k, v in cfg.model_dump().items() if v is not None}
+    updates = cfg.model_dump(exclude_none=True)
     if market_maker:
         market_maker.update_trading_config(**updates)
     return {"status": "updated", "config": updates}
@@ -883,28 +969,33 @@ async def cancel_distribution():
 
 
 # ── Trade History ───────────────────────────────────────────────────
+# SQLite reads are blocking, so they run in the default thread pool
 
 @app.get("/api/v2/orders")
 async def get_orders(limit: int = 50):
-    return {"orders": get_recent_orders(limit)}
+    return {"orders": await asyncio.to_thread(get_recent_orders, limit)}
 
 
 @app.get("/api/v2/positions")
 async def get_positions():
-    return {"positions": get_open_positions()}
+    return {"positions": await asyncio.to_thread(get_open_positions)}
 
 
 @app.get("/api/v2/stats")
 async def get_stats_v2():
+    overall, daily_pnl = await asyncio.gather(
+        asyncio.to_thread(get_trade_stats),
+        asyncio.to_thread(get_daily_pnl, 7),
+    )
     return {
-        "overall": get_trade_stats(),
-        "daily_pnl": get_daily_pnl(7),
+        "overall": overall,
+        "daily_pnl": daily_pnl,
     }
 
 
 @app.get("/api/v2/audit")
 async def get_audit(event_type: Optional[str] = None, limit: int = 100):
-    return {"events": get_audit_log(event_type, limit)}
+    return {"events": await asyncio.to_thread(get_audit_log, event_type, limit)}
 
 
 # ── Strategy / Wyckoff ──────────────────────────────────────────────
@@ -919,33 +1010,96 @@ async def get_wyckoff_phase():
 
 # ── WebSocket for Real-Time Updates ─────────────────────────────────
 
-connected_clients: list[WebSocket] = []
+connected_clients: set[WebSocket] = set()
+
+STATUS_PUSH_INTERVAL_S = 5.0
+WS_SEND_TIMEOUT_S = 1.0  # clients that can't take a snapshot this fast are dropped
+
+
+class StatusHub:
+    """
+    Latest status snapshot, built once and shared by every WebSocket client.
+    A single producer task rebuilds it every STATUS_PUSH_INTERVAL_S, or right
+    away after notify(); clients are only woken when the snapshot changes.
+    """
+
+    def __init__(self):
+        self.last: dict = {}
+        self.last_text: str = "{}"  # `last` serialized once for all clients
+        self._updated = asyncio.Event()
+        self._wakeup = asyncio.Event()
+
+    def notify(self):
+        """Signal a state change so the producer rebuilds the snapshot now."""
+        self._wakeup.set()
+
+    def publish(self, status: dict):
+        if status == self.last:
+            return
+        self.last_text = orjson.dumps(status, option=orjson.OPT_NON_STR_KEYS).decode()
+        self.last = status
+        # Swap in a fresh event so waiters see each update exactly once
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    async def wait_for_update(self):
+        await self._updated.wait()
+
+    async def wait_for_wakeup(self, timeout: float):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+def _current_ws_status() -> dict:
+    if market_maker:
+        return market_maker.get_status()
+    return {
+        "running": False,
+        "risk": risk_manager.get_status() if risk_manager else {},
+        "wallet_pool": wallet_orchestrator.get_pool_status() if wallet_orchestrator else {},
+        "capital": capital_brain.get_status() if capital_brain else {},
+        "bonding_phase": current_phase.value,
+    }
+
+
+async def _status_producer():
+    """Build the status snapshot for WebSocket clients (only while any are connected)."""
+    while True:
+        if connected_clients:
+            try:
+                status_hub.publish(_current_ws_status())
+            except Exception as e:
+                logger.error(f"Status snapshot failed: {e}")
+        await status_hub.wait_for_wakeup(STATUS_PUSH_INTERVAL_S)
 
 
 @app.websocket("/ws/v2/status")
 async def websocket_status(ws: WebSocket):
     """Push-based real-time status updates (replaces polling)."""
     await ws.accept()
-    connected_clients.append(ws)
+    connected_clients.add(ws)
+    status_hub.notify()  # make sure the new client gets a fresh snapshot
     try:
+        sent = None
         while True:
-            if market_maker:
-                status = market_maker.get_status()
-            else:
-                status = {
-                    "running": False,
-                    "risk": risk_manager.get_status() if risk_manager else {},
-                    "wallet_pool": wallet_orchestrator.get_pool_status() if wallet_orchestrator else {},
-                    "capital": capital_brain.get_status() if capital_brain else {},
-                    "bonding_phase": current_phase.value,
-                }
-            await ws.send_json(status)
-            await asyncio.sleep(5)
+            # Don't miss a snapshot published while the previous send was in flight
+            if not status_hub.last or status_hub.last is sent:
+                await status_hub.wait_for_update()
+            sent, text = status_hub.last, status_hub.last_text
+            await asyncio.wait_for(ws.send_text(text), WS_SEND_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        logger.warning("Dropping WebSocket client: status send timed out")
+        try:
+            await asyncio.wait_for(ws.close(), WS_SEND_TIMEOUT_S)
+        except Exception:
+            pass
     except Exception:
         pass
     finally:
-        if ws in connected_clients:
-            connected_clients.remove(ws)
+        connected_clients.discard(ws)
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -957,42 +1111,78 @@ async def root():
     return {"message": "Solana Market Maker API", "version": "2.1.0"}
 
 
+# On-chain balances are refreshed at most once per BALANCE_REFRESH_TTL_S for
+# the polled v1 endpoints; concurrent callers wait on the same refresh.
+BALANCE_REFRESH_TTL_S = 5.0
+_balance_refresh_lock: Optional[asyncio.Lock] = None  # created on first use
+_balance_refreshed_at = 0.0
+
+
+async def _refresh_balances_throttled(force: bool = False):
+    global _balance_refresh_lock, _balance_refreshed_at
+    if not wallet_orchestrator:
+        return
+    if not force and time.monotonic() - _balance_refreshed_at < BALANCE_REFRESH_TTL_S:
+        return
+    if _balance_refresh_lock is None:
+        _balance_refresh_lock = asyncio.Lock()
+    async with _balance_refresh_lock:
+        # Re-check: another caller may have refreshed while we waited
+        if not force and time.monotonic() - _balance_refreshed_at < BALANCE_REFRESH_TTL_S:
+            return
+        await wallet_orchestrator.refresh_balances(client=solana_client)
+        _balance_refreshed_at = time.monotonic()
+        _reconcile_capital()
+
+
+def _reconcile_capital():
+    """Re-read deployed capital after balances change outside the market maker."""
+    if capital_brain and wallet_orchestrator:
+        capital_brain.reconcile(wallet_orchestrator)
+
+
+def _primary_and_enabled_count(wallets: list[dict]) -> tuple[Optional[dict], int]:
+    """
+    Primary active wallet (falling back to the first enabled, then the first
+    wallet) and the number of enabled wallets, in one pass over the pool.
+    """
+    first_enabled = None
+    enabled_count = 0
+    for w in wallets:
+        if w.get("health") != "disabled":
+            enabled_count += 1
+            if first_enabled is None:
+                first_enabled = w
+
+    primary_wallet = None
+    if wallet_orchestrator:
+        primary_wallet_info = wallet_orchestrator.get_primary_wallet()
+        if primary_wallet_info:
+            primary_wallet = {"address": primary_wallet_info.address}
+
+    if not primary_wallet:
+        primary_wallet = first_enabled or (wallets[0] if wallets else None)
+    return primary_wallet, enabled_count
+
+
 @app.get("/api/status")
 async def legacy_status():
     """
     v1 status endpoint — returns data in the format the existing frontend expects.
     Maps v2 state to v1 response shape.
     """
-    # Refresh balances from Solana
-    if wallet_orchestrator:
-        rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-        await wallet_orchestrator.refresh_balances(rpc_url)
+    # Refresh balances from Solana (throttled — the frontend polls this)
+    await _refresh_balances_throttled()
 
     pool = wallet_orchestrator.get_pool_status() if wallet_orchestrator else {
         "total_wallets": 0, "wallets": [], "total_balance_sol": 0
     }
     wallets = pool.get("wallets", [])
 
-    # Get primary active wallet, or fallback to first enabled wallet
-    primary_wallet = None
-    if wallet_orchestrator:
-        primary_wallet_info = wallet_orchestrator.get_primary_wallet()
-        if primary_wallet_info:
-            primary_wallet = {"address": primary_wallet_info.address}
-
-    # Fallback to first enabled wallet if no active wallet
-    if not primary_wallet:
-        enabled_wallets = [w for w in wallets if w.get("health") != "disabled"]
-        primary_wallet = enabled_wallets[0] if enabled_wallets else None
-        if not primary_wallet and wallets:
-            primary_wallet = wallets[0]
+    primary_wallet, enabled_count = _primary_and_enabled_count(wallets)
 
     running = market_maker._running if market_maker else False
-    stats = market_maker._stats if market_maker else {}
-
-    # Count enabled wallets
-    enabled_wallets = [w for w in wallets if w.get("health") != "disabled"]
-    enabled_count = len(enabled_wallets)
+    stats = market_maker.get_stats() if market_maker else {}
 
     # Capital info for v1 frontend
     capital_info = capital_brain.get_status() if capital_brain else {}
@@ -1003,7 +1193,7 @@ async def legacy_status():
             "wallet_loaded": pool["total_wallets"] > 0,
             "public_key": primary_wallet["address"] if primary_wallet else None,
             "balance": pool.get("total_balance_sol", 0),
-            "network": os.getenv("SOLANA_NETWORK", settings.solana_network),
+            "network": ENV.solana_network,
             "total_wallets": pool["total_wallets"],
             "enabled_wallets": enabled_count,
             "all_wallets": wallets,
@@ -1018,7 +1208,7 @@ async def legacy_status():
             "spread_percentage": settings.spread_percentage,
             "order_size": settings.order_size,
             "min_balance": settings.min_balance,
-            "network": os.getenv("SOLANA_NETWORK", settings.solana_network),
+            "network": ENV.solana_network,
         },
         "capital": capital_info,
         "bonding_phase": current_phase.value,
@@ -1028,39 +1218,21 @@ async def legacy_status():
 @app.get("/api/account")
 async def legacy_account():
     """v1 account endpoint — wallet info from the pool."""
-    # Refresh balances from Solana
-    if wallet_orchestrator:
-        rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-        await wallet_orchestrator.refresh_balances(rpc_url)
+    # Refresh balances from Solana (throttled — the frontend polls this)
+    await _refresh_balances_throttled()
 
     pool = wallet_orchestrator.get_pool_status() if wallet_orchestrator else {
         "total_wallets": 0, "wallets": [], "total_balance_sol": 0
     }
     wallets = pool.get("wallets", [])
 
-    # Get primary active wallet, or fallback to first enabled wallet
-    primary_wallet = None
-    if wallet_orchestrator:
-        primary_wallet_info = wallet_orchestrator.get_primary_wallet()
-        if primary_wallet_info:
-            primary_wallet = {"address": primary_wallet_info.address}
-
-    # Fallback to first enabled wallet if no active wallet
-    if not primary_wallet:
-        enabled_wallets = [w for w in wallets if w.get("health") != "disabled"]
-        primary_wallet = enabled_wallets[0] if enabled_wallets else None
-        if not primary_wallet and wallets:
-            primary_wallet = wallets[0]
-
-    # Count enabled wallets
-    enabled_wallets = [w for w in wallets if w.get("health") != "disabled"]
-    enabled_count = len(enabled_wallets)
+    primary_wallet, enabled_count = _primary_and_enabled_count(wallets)
 
     return {
         "wallet_loaded": pool["total_wallets"] > 0,
         "public_key": primary_wallet["address"] if primary_wallet else None,
         "balance": pool.get("total_balance_sol", 0),
-        "network": os.getenv("SOLANA_NETWORK", settings.solana_network),
+        "network": ENV.solana_network,
         "total_wallets": pool["total_wallets"],
         "enabled_wallets": enabled_count,
         "all_wallets": wallets,
@@ -1073,8 +1245,6 @@ async def legacy_create_wallet():
     if not wallet_orchestrator:
         raise HTTPException(500, "Wallet orchestrator not initialized")
 
-    from solders.keypair import Keypair
-
     new_keypair = Keypair()
     address = str(new_keypair.pubkey())
     key_bytes = bytes(new_keypair)  # 64-byte keypair
@@ -1096,8 +1266,7 @@ async def refresh_wallet_balance():
     if not wallet_orchestrator:
         raise HTTPException(500, "Wallet orchestrator not initialized")
 
-    rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-    await wallet_orchestrator.refresh_balances(rpc_url)
+    await _refresh_balances_throttled(force=True)
 
     pool = wallet_orchestrator.get_pool_status()
     return {
@@ -1107,7 +1276,7 @@ async def refresh_wallet_balance():
     }
 
 
-class WalletExportRequest(BaseModel):
+class WalletExportRequest(RequestModel):
     passphrase: str
 
 
@@ -1122,8 +1291,7 @@ async def export_wallet_key(address: str, req: WalletExportRequest):
         raise HTTPException(500, "Wallet orchestrator not initialized")
 
     # Verify passphrase matches
-    env_passphrase = os.getenv("MM_KEYSTORE_PASSPHRASE", "change-this-in-production")
-    if req.passphrase != env_passphrase:
+    if not hmac.compare_digest((req.passphrase or "").encode(), _KEYSTORE_PASSPHRASE_BYTES):
         raise HTTPException(401, "Invalid passphrase")
 
     # Get the key
@@ -1136,9 +1304,6 @@ async def export_wallet_key(address: str, req: WalletExportRequest):
         raise HTTPException(404, "Wallet not found")
 
     try:
-        import base58
-        from solders.keypair import Keypair
-
         # Convert to different formats - handle both 64-byte and 32-byte keys
         if len(key_bytes) == 64:
             keypair = Keypair.from_bytes(key_bytes)
@@ -1150,17 +1315,41 @@ async def export_wallet_key(address: str, req: WalletExportRequest):
         raise HTTPException(500, f"Error converting key: {str(e)}")
 
     # Return in multiple formats for compatibility
-    private_key_base58 = base58.b58encode(bytes(keypair)).decode()
-    private_key_hex = bytes(keypair).hex()
-    private_key_array = list(bytes(keypair))
-
-    return {
+    kp_bytes = bytes(keypair)  # one copy out of solders, reused below
+    private_key_base58 = b58encode(kp_bytes)
+    private_key_hex = kp_bytes.hex()
+    private_key_array = [*kp_bytes]
+
+    # Returned as a Response so FastAPI skips its jsonable_encoder walk over
+    # the 64-int array; orjson encodes it in one C pass.
+    return ORJSONResponse({
         "address": address,
         "private_key_base58": private_key_base58,
         "private_key_hex": private_key_hex,
         "private_key_array": private_key_array,
         "warning": "KEEP THIS PRIVATE KEY SECURE! Never share it with anyone."
-    }
+    })
+
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_BASE58_CHARS = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+
+
+def _sniff_key_format(private_key: str) -> Optional[str]:
+    """
+    Classify a pasted private key without trial decoding: "json" for a byte
+    array, "hex" for a 32/64-byte hex string (optional 0x), "b58" for base58.
+    Returns None if it matches none of them. Expects surrounding whitespace
+    to be stripped already.
+    """
+    if private_key.startswith("["):
+        return "json"
+    hex_body = private_key.removeprefix("0x")
+    if len(hex_body) in (64, 128) and _HEX_CHARS.issuperset(hex_body):
+        return "hex"
+    if private_key and _BASE58_CHARS.issuperset(private_key):
+        return "b58"
+    return None
 
 
 @app.post("/api/wallet/import")
@@ -1174,27 +1363,22 @@ async def legacy_import_wallet(request: WalletImportRequest):
         raise HTTPException(400, "private_key is required")
 
     try:
-        import base58
-        from solders.keypair import Keypair
-
         # Handle different input formats
         key_bytes = None
         if isinstance(private_key, str):
-            # Try base58 decode first
+            private_key = private_key.strip()  # pasted keys often carry a trailing newline
+            key_format = _sniff_key_format(private_key)
             try:
-                key_bytes = base58.b58decode(private_key)
-            except:
-                # Try hex
-                try:
-                    key_bytes = bytes.fromhex(private_key.replace("0x", ""))
-                except:
-                    # Try as array string
-                    try:
-                        import json
-                        key_array = json.loads(private_key)
-                        key_bytes = bytes(key_array)
-                    except:
-                        raise HTTPException(400, "Invalid private key format")
+                if key_format == "b58":
+                    key_bytes = b58decode(private_key)
+                elif key_format == "hex":
+                    key_bytes = bytes.fromhex(private_key.removeprefix("0x"))
+                elif key_format == "json":
+                    key_bytes = bytes(json.loads(private_key))
+            except (ValueError, TypeError):
+                key_bytes = None
+            if key_bytes is None:
+                raise HTTPException(400, "Invalid private key format")
         elif isinstance(private_key, list):
             key_bytes = bytes(private_key)
         else:
@@ -1234,14 +1418,14 @@ async def legacy_start():
     if market_maker and market_maker._running:
         raise HTTPException(400, detail="Market maker already running")
 
-    token_mint = os.getenv("TOKEN_MINT", "")
+    token_mint = ENV.token_mint
     if not token_mint:
         raise HTTPException(
             400,
             detail="TOKEN_MINT not set. Set it in .env or use /api/v2/start with token_mint in body.",
         )
 
-    if not wallet_orchestrator or wallet_orchestrator.get_pool_status()["total_wallets"] == 0:
+    if not wallet_orchestrator or wallet_orchestrator.wallet_count() == 0:
         raise HTTPException(400, detail="No wallets registered. Create or import a wallet first.")
 
     market_maker = MarketMakerV2(
@@ -1251,10 +1435,14 @@ async def legacy_start():
         trade_calculator=trade_calculator,
         risk_manager=risk_manager,
         profit_taker=profit_taker,
+        jupiter=jupiter,
+        rpc_client=solana_client,
         initial_phase=current_phase,
+        on_change=status_hub.notify,
     )
 
     mm_task = asyncio.create_task(market_maker.start())
+    status_hub.notify()
 
     return {
         "success": True,
@@ -1280,8 +1468,9 @@ async def legacy_stop():
         except asyncio.CancelledError:
             pass
         mm_task = None
+    status_hub.notify()
 
-    stats = market_maker._stats if market_maker else {}
+    stats = market_maker.get_stats() if market_maker else {}
     return {
         "success": True,
         "message": "Market maker stopped",
@@ -1329,7 +1518,7 @@ if __name__ == "__main__":
     import uvicorn
 
     host = get_bind_host()
-    port = int(os.getenv("MM_PORT", str(settings.api_port)))
+    port = ENV.mm_port
 
     logger.info(f"Starting server on {host}:{port}")
     uvicorn.run(app, host=host, port=port)
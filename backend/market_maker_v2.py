@@ -26,8 +26,21 @@ import time
 import uuid
 import asyncio
 import logging
+import functools
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    from solana.rpc.async_api import AsyncClient
+    from solders.transaction import VersionedTransaction
+    try:
+        from solana.rpc.models import TxOpts  # newer solana-py
+    except ImportError:
+        from solana.rpc.types import TxOpts
+except ImportError:  # module stays importable without the Solana SDK (e.g. CI)
+    AsyncClient = None
+    TxOpts = None
+    VersionedTransaction = None
 
 from backend.config import settings
 from backend.risk_manager import RiskManager, TradeIntent, RiskAction
@@ -36,7 +49,7 @@ from backend.database import (
     init_database, create_order, update_order_status,
     record_transaction, upsert_position, record_price,
     log_audit_event, record_wallet_snapshot, get_open_positions,
-    record_capital_snapshot,
+    record_capital_snapshot, db_transaction,
 )
 from backend.strategy.wyckoff import (
     WyckoffDetector, MarketSnapshot, WyckoffPhase, TradeSignal,
@@ -49,9 +62,49 @@ from backend.trade_size_calculator import TradeSizeCalculator
 from backend.phase_config import (
     BondingCurvePhase, PhaseConfig, DEFAULT_PHASE_CONFIGS, get_phase_config,
 )
+from backend.utils._njit import njit, as_float_array, index_buffer
 
 logger = logging.getLogger("market_maker_v2")
 
+# Signature-status polling after a send: 0.4s, 0.52s, ... capped at 1.5s
+CONFIRM_POLL_INITIAL_S = 0.4
+CONFIRM_POLL_BACKOFF = 1.3
+CONFIRM_POLL_MAX_S = 1.5
+# Past CONFIRM_TIMEOUT_S an unseen transaction fails once its blockhash has
+# expired; an unconfirmed one is given up on after CONFIRM_MAX_WAIT_S
+CONFIRM_TIMEOUT_S = 30.0
+CONFIRM_MAX_WAIT_S = 120.0
+
+# sendTransaction options, built once (confirmation is polled separately).
+# Preflight simulation is skipped to save an RPC round trip per trade; a swap
+# that fails on-chain or never lands is caught by _wait_for_confirmation instead.
+SEND_TX_OPTS = (
+    TxOpts(skip_preflight=True, preflight_commitment="confirmed")
+    if TxOpts is not None else None
+)
+
+# Trade side per actionable signal; HOLD and NO_ACTION never trade
+_SIGNAL_SIDE = {
+    TradeSignal.BUY: "buy",
+    TradeSignal.STRONG_BUY: "buy",
+    TradeSignal.SELL: "sell",
+    TradeSignal.STRONG_SELL: "sell",
+}
+
+
+@njit(cache=True)
+def _compute_stop_triggers(entries, qtys, current_price, threshold_pct, hits):
+    """Write the indices of positions at or past the stop-loss threshold into `hits`; return the count."""
+    count = 0
+    for i in range(len(entries)):
+        entry = entries[i]
+        if entry <= 0 or qtys[i] <= 0:
+            continue
+        if ((entry - current_price) / entry) * 100 >= threshold_pct:
+            hits[count] = i
+            count += 1
+    return count
+
 
 @dataclass
 class TradingConfig:
@@ -95,6 +148,8 @@ class MarketMakerV2:
         jupiter: JupiterAdapter = None,
         trading_config: TradingConfig = None,
         initial_phase: BondingCurvePhase = BondingCurvePhase.STEALTH_ACCUMULATION,
+        rpc_client=None,
+        on_change: Optional[Callable[[], None]] = None,
     ):
         self.wallet_orchestrator = wallet_orchestrator
         self.token_mint = token_mint
@@ -106,11 +161,19 @@ class MarketMakerV2:
         self.wyckoff = wyckoff_detector or WyckoffDetector()
         self.profit_taker = profit_taker or ProfitTaker()
         self.jupiter = jupiter or JupiterAdapter()
+        self._owns_jupiter = jupiter is None  # shared adapters are closed by their owner
+        # Solana RPC AsyncClient reused for every send and confirmation poll;
+        # created in start() unless a shared one is passed in
+        self._rpc_client = rpc_client
+        self._owns_rpc_client = rpc_client is None
         self.trading_config = trading_config or TradingConfig.from_env()
+        # Called after state changes that show up in get_status()
+        self.on_change = on_change
 
         # Phase management
         self.current_phase = initial_phase
         self.phase_config = get_phase_config(initial_phase)
+        self._rebuild_intent_factory()
 
         # Apply phase config to risk manager
         self.risk_manager.update_from_phase_config(self.phase_config)
@@ -122,18 +185,15 @@ class MarketMakerV2:
         self._cycle_interval_s = self.phase_config.cycle_interval_s
         self._capital_snapshot_interval = 50  # Record capital snapshot every N cycles
 
-        # Stats
-        self._stats = {
-            "started_at": 0,
-            "cycles": 0,
-            "trades_attempted": 0,
-            "trades_filled": 0,
-            "trades_rejected_risk": 0,
-            "trades_failed": 0,
-            "stop_losses_triggered": 0,
-            "total_volume_sol": 0,
-            "uptime_s": 0,
-        }
+        # Stats (plain counters; get_stats() builds the dict for the API)
+        self._started_at = 0
+        self._trades_attempted = 0
+        self._trades_filled = 0
+        self._trades_rejected_risk = 0
+        self._trades_failed = 0
+        self._stop_losses_triggered = 0
+        self._total_volume_sol = 0
+        self._uptime_s = 0
 
     # ── Lifecycle ───────────────────────────────────────────────────
 
@@ -144,8 +204,10 @@ class MarketMakerV2:
             return
 
         init_database()
+        if self._rpc_client is None:
+            self._rpc_client = AsyncClient(os.getenv("RPC_URL", settings.rpc_url))
         self._running = True
-        self._stats["started_at"] = time.time()
+        self._started_at = time.time()
 
         log_audit_event("system", "operator", "start_market_maker",
                         f"token:{self.token_mint}", "success",
@@ -156,6 +218,7 @@ class MarketMakerV2:
         logger.info(f"Phase: {self.phase_config.phase_name}")
         logger.info(f"Budget: ${self.capital_brain.total_budget_usd:.0f} USD")
         logger.info(f"Cycle interval: {self._cycle_interval_s}s")
+        self._notify_change()
 
         try:
             while self._running:
@@ -168,7 +231,12 @@ class MarketMakerV2:
             self.risk_manager.emergency_shutdown()
         finally:
             self._running = False
-            await self.jupiter.close()
+            self._notify_change()
+            if self._owns_jupiter:
+                await self.jupiter.close()
+            if self._owns_rpc_client and self._rpc_client is not None:
+                await self._rpc_client.close()
+                self._rpc_client = None
 
     def stop(self):
         """Gracefully stop the market maker."""
@@ -176,6 +244,7 @@ class MarketMakerV2:
         log_audit_event("system", "operator", "stop_market_maker",
                         f"token:{self.token_mint}", "success")
         logger.info("Market maker stopping...")
+        self._notify_change()
 
     # ── Phase Management ─────────────────────────────────────────────
 
@@ -184,6 +253,7 @@ class MarketMakerV2:
         old_phase = self.current_phase
         self.current_phase = phase
         self.phase_config = get_phase_config(phase)
+        self._rebuild_intent_factory()
 
         # Update cycle interval
         self._cycle_interval_s = self.phase_config.cycle_interval_s
@@ -199,20 +269,37 @@ class MarketMakerV2:
             f"Phase transition: {old_phase.value} -> {phase.value} "
             f"({self.phase_config.phase_name})"
         )
+        self._notify_change()
+
+    def _notify_change(self):
+        if self.on_change is not None:
+            self.on_change()
+
+    def _rebuild_intent_factory(self):
+        """TradeIntent factory with this token and the current phase's slippage filled in."""
+        self._mk_intent = functools.partial(
+            TradeIntent,
+            token_mint=self.token_mint,
+            max_slippage_percent=self.phase_config.max_slippage_pct,
+        )
 
     # ── Main Cycle ──────────────────────────────────────────────────
 
     async def _run_cycle(self):
         """One complete market making cycle — all layers working together."""
         self._cycle_count += 1
-        cycle_start = time.time()
 
         try:
             # ── Capital Brain Refresh ────────────────────────────────
             await self.capital_brain.refresh(self.wallet_orchestrator)
 
-            # ── Layer 1: Market Data ────────────────────────────────
-            price = await self._fetch_market_data()
+            # ── Layer 1: Market Data (+ positions for the stop-loss check) ──
+            if self._stop_loss_active():
+                price, positions = await asyncio.gather(
+                    self._fetch_market_data(), self._load_open_positions(),
+                )
+            else:
+                price, positions = await self._fetch_market_data(), None
             if price is None or price <= 0:
                 logger.debug("No valid price data — skipping cycle")
                 return
@@ -220,19 +307,18 @@ class MarketMakerV2:
             # ── Layer 2: Strategy / Wyckoff ─────────────────────────
             analysis = self.wyckoff.analyze()
 
-            if self._cycle_count % 10 == 0:
+            if self._cycle_count % 10 == 0 and logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"Cycle {self._cycle_count}: "
-                    f"price={price:.8f} "
-                    f"phase={analysis.phase.value} "
-                    f"signal={analysis.signal.value} "
-                    f"confidence={analysis.confidence:.0%} "
-                    f"bonding_phase={self.current_phase.value} "
-                    f"capital_util={self.capital_brain.capital_utilization_pct:.1f}%"
+                    "Cycle %d: price=%.8f phase=%s signal=%s confidence=%.0f%% "
+                    "bonding_phase=%s capital_util=%.1f%%",
+                    self._cycle_count, price, analysis.phase.value, analysis.signal.value,
+                    analysis.confidence * 100, self.current_phase.value,
+                    self.capital_brain.capital_utilization_pct,
                 )
 
             # ── Stop Loss Check ─────────────────────────────────────
-            await self._check_stop_losses(price)
+            if positions:
+                await self._check_stop_losses(price, positions)
 
             # ── Layer 7: Check Profit-Taking Schedule ───────────────
             await self._check_profit_taking(price, analysis)
@@ -246,11 +332,12 @@ class MarketMakerV2:
             risk_decision = self.risk_manager.evaluate_trade(trade_intent)
 
             if risk_decision.action != RiskAction.APPROVED:
-                self._stats["trades_rejected_risk"] += 1
+                self._trades_rejected_risk += 1
                 log_audit_event("risk", "system", "trade_rejected",
                                 f"token:{self.token_mint}",
                                 risk_decision.action.value,
                                 {"reason": risk_decision.reason})
+                self._notify_change()
                 return
 
             # ── Layer 4+5: Execution ────────────────────────────────
@@ -263,8 +350,7 @@ class MarketMakerV2:
         except Exception as e:
             logger.error(f"Cycle {self._cycle_count} error: {e}", exc_info=True)
 
-        self._stats["cycles"] = self._cycle_count
-        self._stats["uptime_s"] = time.time() - self._stats["started_at"]
+        self._uptime_s = time.time() - self._started_at
 
     # ── Market Data Fetching ────────────────────────────────────────
 
@@ -296,71 +382,77 @@ class MarketMakerV2:
 
     # ── Stop Loss Enforcement ───────────────────────────────────────
 
-    async def _check_stop_losses(self, current_price: float):
+    def _stop_loss_active(self) -> bool:
+        """Stop loss can be disabled per phase (e.g., during accumulation)."""
+        return self.phase_config.stop_loss_enabled and self.phase_config.stop_loss_pct > 0
+
+    @staticmethod
+    async def _load_open_positions() -> Optional[list]:
+        """Read open positions off the event loop; None if the read fails."""
+        try:
+            return await asyncio.to_thread(get_open_positions)
+        except Exception:
+            return None
+
+    async def _check_stop_losses(self, current_price: float, positions: list):
         """
-        Check all open positions for stop-loss triggers.
+        Check open positions (read alongside the price this cycle) for stop-loss triggers.
         Respects phase config: stop loss can be disabled (e.g., during accumulation).
         """
-        if not self.phase_config.stop_loss_enabled:
+        if not self._stop_loss_active():
             return  # Stop loss disabled for this phase
-
         stop_loss_pct = self.phase_config.stop_loss_pct
-        if stop_loss_pct <= 0:
-            return
 
-        try:
-            positions = get_open_positions()
-        except Exception:
+        # Open positions in this token as entry-price / quantity columns
+        held = [pos for pos in positions if pos.get("token_mint") == self.token_mint]
+        if not held:
+            return
+        hits = index_buffer(len(held))
+        count = _compute_stop_triggers(
+            as_float_array([pos.get("average_entry_price", 0) for pos in held]),
+            as_float_array([pos.get("quantity", 0) for pos in held]),
+            float(current_price), float(stop_loss_pct), hits,
+        )
+        if count == 0:
             return
 
-        for pos in positions:
-            if pos.get("token_mint") != self.token_mint:
-                continue
-            if pos.get("quantity", 0) <= 0:
-                continue
-
-            entry_price = pos.get("average_entry_price", 0)
-            if entry_price <= 0:
-                continue
+        # Max sell size from phase config (same for every position this cycle)
+        phase_alloc_usd = self.capital_brain.get_phase_allocation_usd(
+            self.phase_config.phase_capital_allocation_pct
+        )
+        max_trade_usd = (self.phase_config.max_trade_size_pct / 100) * phase_alloc_usd
+        max_trade_sol = self.capital_brain.usd_to_sol(max_trade_usd)
 
-            # Calculate loss percentage
+        for k in range(count):
+            pos = held[hits[k]]
+            entry_price = pos["average_entry_price"]
             loss_pct = ((entry_price - current_price) / entry_price) * 100
+            wallet_addr = pos["wallet_address"]
+            logger.warning(
+                f"STOP LOSS triggered: wallet {wallet_addr[:8]}... "
+                f"loss={loss_pct:.1f}% (threshold: {stop_loss_pct}%)"
+            )
+            self._stop_losses_triggered += 1
+
+            # Create forced sell intent
+            intent = self._mk_intent(
+                wallet_address=wallet_addr,
+                side="sell",
+                amount_sol=min(pos["quantity"], max_trade_sol),
+                expected_price=current_price,
+                strategy_reason=f"STOP_LOSS: {loss_pct:.1f}% loss (threshold: {stop_loss_pct}%)",
+            )
 
-            if loss_pct >= stop_loss_pct:
-                wallet_addr = pos["wallet_address"]
-                logger.warning(
-                    f"STOP LOSS triggered: wallet {wallet_addr[:8]}... "
-                    f"loss={loss_pct:.1f}% (threshold: {stop_loss_pct}%)"
-                )
-                self._stats["stop_losses_triggered"] += 1
-
-                # Calculate max sell size from phase config
-                phase_alloc_usd = self.capital_brain.get_phase_allocation_usd(
-                    self.phase_config.phase_capital_allocation_pct
-                )
-                max_trade_usd = (self.phase_config.max_trade_size_pct / 100) * phase_alloc_usd
-                max_trade_sol = self.capital_brain.usd_to_sol(max_trade_usd)
-
-                # Create forced sell intent
-                intent = TradeIntent(
-                    wallet_address=wallet_addr,
-                    token_mint=self.token_mint,
-                    side="sell",
-                    amount_sol=min(pos["quantity"], max_trade_sol),
-                    expected_price=current_price,
-                    max_slippage_percent=self.phase_config.max_slippage_pct,
-                    strategy_reason=f"STOP_LOSS: {loss_pct:.1f}% loss (threshold: {stop_loss_pct}%)",
+            # Stop loss still goes through risk checks (but most will pass for sells)
+            decision = self.risk_manager.evaluate_trade(intent)
+            if decision.action == RiskAction.APPROVED:
+                await self._execute_trade(intent, current_price)
+            else:
+                logger.error(
+                    f"Stop loss sell BLOCKED by risk manager: {decision.reason}. "
+                    f"Consider manual intervention."
                 )
-
-                # Stop loss still goes through risk checks (but most will pass for sells)
-                decision = self.risk_manager.evaluate_trade(intent)
-                if decision.action == RiskAction.APPROVED:
-                    await self._execute_trade(intent, current_price)
-                else:
-                    logger.error(
-                        f"Stop loss sell BLOCKED by risk manager: {decision.reason}. "
-                        f"Consider manual intervention."
-                    )
+                self._notify_change()
 
     # ── Signal to Intent Conversion ─────────────────────────────────
 
@@ -382,26 +474,24 @@ class MarketMakerV2:
         if analysis.confidence < self.trading_config.min_confidence:
             return None
 
-        # Phase-level signal filtering
-        if self.phase_config.force_buy_mode:
-            # In force_buy_mode, block all sell signals
-            if analysis.signal in (TradeSignal.SELL, TradeSignal.STRONG_SELL):
-                logger.debug(
-                    f"Phase '{self.phase_config.phase_name}' blocks sell signals (force_buy_mode)"
-                )
-                return None
-            # In force_buy_mode, convert HOLD to BUY if confidence is high enough
-            if analysis.signal == TradeSignal.HOLD:
-                return None
+        # One phase config for the whole decision, even if the phase is
+        # switched while the size calculation is awaited
+        phase, mk_intent = self.phase_config, self._mk_intent
 
-        # Skip HOLD signals
-        if analysis.signal == TradeSignal.HOLD:
+        # Skip HOLD / NO_ACTION signals
+        side = _SIGNAL_SIDE.get(analysis.signal)
+        if side is None:
+            return None
+
+        # Phase-level signal filtering: force_buy_mode blocks all sell signals
+        if side == "sell" and phase.force_buy_mode:
+            logger.debug("Phase '%s' blocks sell signals (force_buy_mode)", phase.phase_name)
             return None
 
         # Calculate trade size dynamically from phase config
         trade_sol = await self.trade_calculator.calculate(
             signal=analysis.signal,
-            phase_config=self.phase_config,
+            phase_config=phase,
         )
 
         if trade_sol <= 0:
@@ -410,34 +500,26 @@ class MarketMakerV2:
         # Select wallet for this trade
         wallet = self.wallet_orchestrator.get_wallet(
             strategy=SelectionStrategy.HEALTH_BASED,
-            min_balance=trade_sol if analysis.signal in (TradeSignal.BUY, TradeSignal.STRONG_BUY) else 0.01,
+            min_balance=trade_sol if side == "buy" else 0.01,
         )
         if not wallet:
             logger.warning("No wallet available for trade")
             return None
 
-        # Determine side
-        if analysis.signal in (TradeSignal.BUY, TradeSignal.STRONG_BUY):
-            side = "buy"
-        else:
-            side = "sell"
-
         trade_usd = self.capital_brain.sol_to_usd(trade_sol)
         logger.info(
-            f"Trade intent: {side} {trade_sol:.4f} SOL (${trade_usd:.2f}) "
-            f"[{self.phase_config.phase_name}, {analysis.signal.value}]"
+            "Trade intent: %s %.4f SOL ($%.2f) [%s, %s]",
+            side, trade_sol, trade_usd, phase.phase_name, analysis.signal.value,
         )
 
-        return TradeIntent(
+        return mk_intent(
             wallet_address=wallet.address,
-            token_mint=self.token_mint,
             side=side,
             amount_sol=trade_sol,
             expected_price=price,
-            max_slippage_percent=self.phase_config.max_slippage_pct,
             strategy_reason=(
-                f"{self.phase_config.phase_name} | {analysis.reason} | "
-                f"${trade_usd:.2f} ({self.phase_config.base_trade_size_pct}% of phase)"
+                f"{phase.phase_name} | {analysis.reason} | "
+                f"${trade_usd:.2f} ({phase.base_trade_size_pct}% of phase)"
             ),
         )
 
@@ -445,7 +527,7 @@ class MarketMakerV2:
 
     async def _execute_trade(self, intent: TradeIntent, price: float):
         """Execute an approved trade through the full pipeline."""
-        self._stats["trades_attempted"] += 1
+        self._trades_attempted += 1
 
         # Create order record in database
         order_id = create_order(
@@ -491,48 +573,50 @@ class MarketMakerV2:
             swap_function=_execute_swap,
         )
 
-        # Update database based on result
+        # Update database based on result: order status, position and
+        # transaction rows land in a single commit
         success = result_order.state.value == "filled"
-
-        update_order_status(
-            order_id=order_id,
-            status=result_order.state.value,
-            filled_quantity=result_order.filled_amount,
-            average_fill_price=result_order.average_fill_price,
-            slippage_percent=result_order.actual_slippage,
-            error_message=result_order.error_message,
-        )
-
-        if success:
-            self._stats["trades_filled"] += 1
-            self._stats["total_volume_sol"] += intent.amount_sol
-
-            # Update position
-            qty_delta = intent.amount_sol if intent.side == "buy" else -intent.amount_sol
-            upsert_position(
-                wallet_address=intent.wallet_address,
-                token_mint=intent.token_mint,
-                quantity_delta=qty_delta,
-                price=result_order.average_fill_price or price,
+        qty_delta = intent.amount_sol if intent.side == "buy" else -intent.amount_sol
+
+        with db_transaction():
+            update_order_status(
+                order_id=order_id,
+                status=result_order.state.value,
+                filled_quantity=result_order.filled_amount,
+                average_fill_price=result_order.average_fill_price,
+                slippage_percent=result_order.actual_slippage,
+                error_message=result_order.error_message,
             )
 
-            self.wallet_orchestrator.record_success(intent.wallet_address)
-
-            if result_order.tx_signature:
-                record_transaction(
-                    tx_signature=result_order.tx_signature,
+            if success:
+                upsert_position(
                     wallet_address=intent.wallet_address,
-                    transaction_type=f"swap_{intent.side}",
-                    amount_sol=intent.amount_sol,
-                    order_id=order_id,
-                    status="confirmed",
+                    token_mint=intent.token_mint,
+                    quantity_delta=qty_delta,
+                    price=result_order.average_fill_price or price,
                 )
+
+                if result_order.tx_signature:
+                    record_transaction(
+                        tx_signature=result_order.tx_signature,
+                        wallet_address=intent.wallet_address,
+                        transaction_type=f"swap_{intent.side}",
+                        amount_sol=intent.amount_sol,
+                        order_id=order_id,
+                        status="confirmed",
+                    )
+
+        if success:
+            self._trades_filled += 1
+            self._total_volume_sol += intent.amount_sol
+            self.wallet_orchestrator.record_success(intent.wallet_address)
+            self.capital_brain.on_fill(-qty_delta)  # buys spend pooled SOL, sells return it
         else:
-            self._stats["trades_failed"] += 1
+            self._trades_failed += 1
             self.wallet_orchestrator.record_failure(intent.wallet_address)
-
         # Update risk manager
         self.risk_manager.record_trade_executed(intent, success)
+        self._notify_change()
 
     # ── Transaction Signing ─────────────────────────────────────────
 
@@ -543,71 +627,113 @@ class MarketMakerV2:
         Uses solders for transaction deserialization and signing,
         and solana-py async client for RPC submission.
         """
-        from solders.keypair import Keypair
-        from solders.transaction import VersionedTransaction
-        from solana.rpc.async_api import AsyncClient
-
-        # 1. Get the decrypted private key
-        key_bytes = self.wallet_orchestrator.get_signing_key(wallet_address)
-        if not key_bytes:
+        # 1+2. Keypair for this wallet — decrypted and built once, then cached
+        # by the orchestrator until the wallet is disabled/removed
+        keypair = self.wallet_orchestrator.get_keypair(wallet_address)
+        if keypair is None:
             raise Exception("Failed to retrieve signing key from encrypted keystore")
 
-        # 2. Create Keypair (handle both 64-byte full keypair and 32-byte seed)
-        if len(key_bytes) == 64:
-            keypair = Keypair.from_bytes(key_bytes)
-        elif len(key_bytes) == 32:
-            keypair = Keypair.from_seed(key_bytes)
-        else:
-            raise Exception(f"Invalid key length: {len(key_bytes)} (expected 32 or 64)")
-
         # 3. Deserialize the transaction Jupiter gave us
         unsigned_tx = VersionedTransaction.from_bytes(tx_bytes)
 
         # 4. Sign it — create new VersionedTransaction with the message and our keypair
         signed_tx = VersionedTransaction(unsigned_tx.message, [keypair])
 
-        # 5. Send to Solana RPC
-        rpc_url = os.getenv("RPC_URL", settings.rpc_url)
-        async with AsyncClient(rpc_url) as rpc_client:
-            # send_raw_transaction expects bytes
-            resp = await rpc_client.send_raw_transaction(
-                bytes(signed_tx),
-                opts={"skip_preflight": False, "preflight_commitment": "confirmed"},
-            )
+        # 5. Send to Solana RPC (shared client, keeps its connection alive)
+        # The signed wire bytes are produced once here; solders base64-encodes
+        # them natively when building the sendTransaction request
+        rpc_client = self._rpc_client
+        resp = await rpc_client.send_raw_transaction(bytes(signed_tx), opts=SEND_TX_OPTS)
 
-            if hasattr(resp, 'value') and resp.value:
-                tx_sig = str(resp.value)
-                logger.info(f"Transaction sent: {tx_sig[:20]}...")
+        if hasattr(resp, 'value') and resp.value:
+            tx_sig = str(resp.value)
+            logger.info("Transaction sent: %s...", tx_sig[:20])
 
-                # Wait briefly for confirmation
-                await self._wait_for_confirmation(rpc_client, tx_sig)
+            # Wait for confirmation; raises if the swap did not land
+            await self._wait_for_confirmation(rpc_client, tx_sig, signed_tx.message)
 
-                return tx_sig
-            else:
-                error_msg = str(resp) if resp else "No response"
-                raise Exception(f"Transaction send failed: {error_msg}")
+            return tx_sig
+        else:
+            error_msg = str(resp) if resp else "No response"
+            raise Exception(f"Transaction send failed: {error_msg}")
 
-    async def _wait_for_confirmation(self, rpc_client, tx_sig: str, timeout_s: float = 30.0):
-        """Wait for transaction confirmation on-chain."""
-        start = time.time()
-        while time.time() - start < timeout_s:
+    async def _wait_for_confirmation(self, rpc_client, tx_sig: str, message,
+                                     timeout_s: float = CONFIRM_TIMEOUT_S):
+        """
+        Wait for transaction confirmation on-chain.
+        Polls fast at first (most transactions land within a few slots),
+        then backs off to CONFIRM_POLL_MAX_S.
+
+        Sends skip preflight simulation, so this is where a swap that did not
+        land is caught. Raises unless the transaction confirms:
+        - its signature status carries an on-chain error
+        - it has no status after timeout_s and the message's blockhash has
+          expired, so it can never land. The error names
+          TransactionExpiredBlockheightExceededError, which OrderManager
+          retries with a fresh quote
+        - it is still unconfirmed after CONFIRM_MAX_WAIT_S. Not retryable,
+          since it may still land
+        """
+        start = time.monotonic()
+        deadline = start + timeout_s
+        give_up_at = start + max(timeout_s, CONFIRM_MAX_WAIT_S)
+        interval = CONFIRM_POLL_INITIAL_S
+        expired = False
+        while True:
+            polled, status = False, None
             try:
                 resp = await rpc_client.get_signature_statuses([tx_sig])
+                polled = True
                 if resp and hasattr(resp, 'value') and resp.value and resp.value[0]:
                     status = resp.value[0]
-                    if hasattr(status, 'err') and status.err:
-                        logger.error(f"Transaction failed on-chain: {status.err}")
-                        return
-                    conf = getattr(status, 'confirmation_status', None)
-                    if conf and str(conf) in ("confirmed", "finalized"):
-                        logger.info(f"Transaction confirmed: {tx_sig[:16]}...")
-                        return
             except Exception as e:
-                logger.debug(f"Confirmation check: {e}")
+                logger.debug("Confirmation check: %s", e)
+
+            if status is not None:
+                onchain_err = getattr(status, 'err', None)
+                if onchain_err:
+                    logger.error("Transaction failed on-chain: %s", onchain_err)
+                    raise Exception(f"Transaction failed on-chain: {onchain_err}")
+                conf = getattr(status, 'confirmation_status', None)
+                if conf and str(conf) in ("confirmed", "finalized"):
+                    logger.info("Transaction confirmed: %s...", tx_sig[:16])
+                    return
+            elif expired and polled:
+                # Blockhash gone and still no status on the poll after it
+                logger.error("Transaction expired without landing: %s...", tx_sig[:16])
+                raise Exception(
+                    f"TransactionExpiredBlockheightExceededError: {tx_sig} "
+                    f"was not confirmed before its blockhash expired"
+                )
 
-            await asyncio.sleep(1.5)
+            now = time.monotonic()
+            if now >= deadline:
+                if status is None and not expired:
+                    expired = not await self._blockhash_valid(rpc_client, message)
+                    if expired:
+                        continue  # poll the status once more before giving up
+                if now >= give_up_at:
+                    logger.error(
+                        "Transaction confirmation timed out (may still confirm): %s", tx_sig
+                    )
+                    raise Exception(
+                        f"Transaction not confirmed after {now - start:.0f}s "
+                        f"(may still confirm): {tx_sig}"
+                    )
 
-        logger.warning(f"Transaction confirmation timed out (may still confirm): {tx_sig[:16]}...")
+            await asyncio.sleep(interval)
+            interval = min(interval * CONFIRM_POLL_BACKOFF, CONFIRM_POLL_MAX_S)
+
+    @staticmethod
+    async def _blockhash_valid(rpc_client, message) -> bool:
+        """False once the message's recent blockhash has expired; True if unknown."""
+        try:
+            resp = await rpc_client.get_fee_for_message(message)
+        except Exception as e:
+            logger.debug("Blockhash validity check: %s", e)
+            return True
+        # The fee lookup returns null for a blockhash the cluster no longer knows
+        return getattr(resp, 'value', None) is not None
 
     # ── Profit-Taking ───────────────────────────────────────────────
 
@@ -619,20 +745,18 @@ class MarketMakerV2:
         )
 
         if step and step.amount > 0:
-            logger.info(f"Profit-taking step: sell {step.amount} ({step.reason})")
+            logger.info("Profit-taking step: sell %s (%s)", step.amount, step.reason)
 
             wallet = self.wallet_orchestrator.get_wallet(
                 strategy=SelectionStrategy.WEIGHTED,
                 min_balance=0.01,
             )
             if wallet:
-                intent = TradeIntent(
+                intent = self._mk_intent(
                     wallet_address=wallet.address,
-                    token_mint=self.token_mint,
                     side="sell",
                     amount_sol=step.amount,
                     expected_price=price,
-                    max_slippage_percent=self.phase_config.max_slippage_pct,
                     strategy_reason=f"profit_taking: {step.reason}",
                 )
 
@@ -654,10 +778,23 @@ class MarketMakerV2:
                 capital_utilization_pct=self.capital_brain.capital_utilization_pct,
             )
         except Exception as e:
-            logger.debug(f"Failed to record capital snapshot: {e}")
+            logger.debug("Failed to record capital snapshot: %s", e)
 
     # ── Status & Config ─────────────────────────────────────────────
 
+    def get_stats(self) -> dict:
+        return {
+            "started_at": self._started_at,
+            "cycles": self._cycle_count,
+            "trades_attempted": self._trades_attempted,
+            "trades_filled": self._trades_filled,
+            "trades_rejected_risk": self._trades_rejected_risk,
+            "trades_failed": self._trades_failed,
+            "stop_losses_triggered": self._stop_losses_triggered,
+            "total_volume_sol": self._total_volume_sol,
+            "uptime_s": self._uptime_s,
+        }
+
     def get_status(self) -> dict:
         return {
             "running": self._running,
@@ -666,7 +803,7 @@ class MarketMakerV2:
             "cycle_interval_s": self._cycle_interval_s,
             "last_price": self._last_price,
             "current_wyckoff_phase": self.wyckoff.get_current_phase().value,
-            "stats": self._stats,
+            "stats": self.get_stats(),
             "risk": self.risk_manager.get_status(),
             "wallet_pool": self.wallet_orchestrator.get_pool_status(),
             "profit_taking": self.profit_taker.get_status(),
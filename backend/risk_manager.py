@@ -13,7 +13,7 @@ import time
 import logging
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 from threading import Lock
 
 logger = logging.getLogger("risk_manager")
@@ -176,13 +176,21 @@ class RiskManager:
     evaluate_trade() before execution. No exceptions.
 
     Uses Capital Brain for percentage-based limit calculations.
+    on_change, if given, is called after state changes that show up in
+    get_status() (trades, breaker trips, rule and shutdown changes).
     """
 
-    def __init__(self, rules: Optional[RiskRules] = None, capital_brain=None):
+    def __init__(
+        self,
+        rules: Optional[RiskRules] = None,
+        capital_brain=None,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
         self.rules = rules or RiskRules()
         self.state = RiskState()
         self.circuit_breaker = CircuitBreaker(self.rules.breaker_cooldown_s)
         self.capital_brain = capital_brain
+        self.on_change = on_change
         self._lock = Lock()
         self._price_history: list = []
 
@@ -389,6 +397,7 @@ class RiskManager:
                     self.circuit_breaker.trip(
                         f"{self.state.failed_transactions} consecutive transaction failures"
                     )
+        self._notify_change()
 
     def update_portfolio_value(self, value_sol: float):
         """Call periodically with current portfolio value for drawdown tracking."""
@@ -413,6 +422,7 @@ class RiskManager:
                     self.circuit_breaker.trip(
                         f"Rapid price change: {change_pct:.1f}% in {self.rules.rapid_price_change_window_s}s"
                     )
+                    self._notify_change()
 
     # ── Emergency controls ──────────────────────────────────────────
 
@@ -421,12 +431,14 @@ class RiskManager:
         self.state.emergency_shutdown = True
         self.circuit_breaker.trip("EMERGENCY SHUTDOWN activated")
         logger.critical("EMERGENCY SHUTDOWN — all trading halted")
+        self._notify_change()
 
     def reset_emergency(self):
         """Manually resume trading after emergency shutdown."""
         self.state.emergency_shutdown = False
         self.circuit_breaker.reset()
         logger.info("Emergency shutdown cleared — trading can resume")
+        self._notify_change()
 
     # ── Phase Integration ────────────────────────────────────────────
 
@@ -447,9 +459,14 @@ class RiskManager:
             f"max_exposure={phase_config.max_phase_exposure_pct}%, "
             f"max_drawdown={phase_config.max_drawdown_pct}%"
         )
+        self._notify_change()
 
     # ── Helpers ──────────────────────────────────────────────────────
 
+    def _notify_change(self):
+        if self.on_change is not None:
+            self.on_change()
+
     def _calculate_drawdown(self) -> float:
         if self.state.peak_portfolio_value <= 0:
             return 0.0
@@ -473,6 +490,7 @@ class RiskManager:
                 logger.info(f"Risk rule updated: {key} = {value}")
             else:
                 logger.warning(f"Unknown risk rule: {key}")
+        self._notify_change()
 
     def get_status(self) -> dict:
         status = {
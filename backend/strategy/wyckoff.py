@@ -11,13 +11,15 @@ Wyckoff applied to compressed memecoin timeframes:
 - Markdown: breakdown, panic selling → STRONG_SELL / wait for re-accumulation
 """
 
+import math
 import time
 import logging
-import statistics
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Optional
 
+from backend.utils._njit import njit, as_float_array
+
 logger = logging.getLogger("strategy.wyckoff")
 
 
@@ -90,6 +92,98 @@ class WyckoffConfig:
     min_data_points: int = 10
 
 
+@njit(cache=True)
+def _wyckoff_scan(prices, volumes, trend_lookback, volume_lookback):
+    """
+    Compute every numeric input of the phase detector from the raw history.
+
+    Returns (price_change_pct, volume_change_pct, price_range_pct,
+    momentum_pct, earlier_min, earlier_max). The change percentages are
+    half-window average comparisons and are NaN when there is too little
+    (or non-positive) data; earlier_* cover the window preceding the trend
+    lookback and are NaN when it is empty.
+    """
+    n = len(prices)
+
+    # Price trend and range over the last `trend_lookback` points
+    start = max(0, n - trend_lookback)
+    count = n - start
+    price_change = math.nan
+    price_range = 0.0
+    if count > 0:
+        half = count // 2
+        first_sum = 0.0
+        second_sum = 0.0
+        lo = prices[start]
+        hi = prices[start]
+        for i in range(start, n):
+            p = prices[i]
+            if i - start < half:
+                first_sum += p
+            else:
+                second_sum += p
+            if p < lo:
+                lo = p
+            if p > hi:
+                hi = p
+        if count >= 3:
+            first_avg = first_sum / half
+            second_avg = second_sum / (count - half)
+            if first_avg > 0:
+                price_change = (second_avg - first_avg) / first_avg * 100.0
+        if lo > 0:
+            price_range = (hi - lo) / lo * 100.0
+
+    # Volume trend over the last `volume_lookback` points with volume > 0
+    vstart = max(0, n - volume_lookback)
+    vcount = 0
+    for i in range(vstart, n):
+        if volumes[i] > 0:
+            vcount += 1
+    volume_change = math.nan
+    if vcount >= 4:
+        vhalf = vcount // 2
+        seen = 0
+        first_sum = 0.0
+        second_sum = 0.0
+        for i in range(vstart, n):
+            v = volumes[i]
+            if v > 0:
+                if seen < vhalf:
+                    first_sum += v
+                else:
+                    second_sum += v
+                seen += 1
+        first_avg = first_sum / vhalf
+        second_avg = second_sum / (vcount - vhalf)
+        if first_avg > 0:
+            volume_change = (second_avg - first_avg) / first_avg * 100.0
+
+    # Momentum: last price vs 5 points back
+    momentum = 0.0
+    if n >= 5:
+        earlier = prices[n - 5]
+        if earlier > 0:
+            momentum = (prices[n - 1] - earlier) / earlier * 100.0
+
+    # Window before the trend lookback, for prior up/downtrend checks
+    estart = max(0, n - 2 * trend_lookback)
+    eend = max(0, n - trend_lookback)
+    earlier_min = math.nan
+    earlier_max = math.nan
+    if eend > estart:
+        earlier_min = prices[estart]
+        earlier_max = prices[estart]
+        for i in range(estart + 1, eend):
+            p = prices[i]
+            if p < earlier_min:
+                earlier_min = p
+            if p > earlier_max:
+                earlier_max = p
+
+    return price_change, volume_change, price_range, momentum, earlier_min, earlier_max
+
+
 class WyckoffDetector:
     """
     Detects Wyckoff market cycle phases from price and volume data.
@@ -102,6 +196,8 @@ class WyckoffDetector:
         self._current_phase: WyckoffPhase = WyckoffPhase.UNKNOWN
         self._phase_start_time: float = 0.0
         self._phase_start_price: float = 0.0
+        # (min, max) price of the window before the trend lookback, from the last scan
+        self._earlier_range: tuple = (math.nan, math.nan)
 
     def add_data(self, snapshot: MarketSnapshot):
         """Feed new market data into the detector."""
@@ -122,10 +218,18 @@ class WyckoffDetector:
                 suggested_action="Wait for more data before trading",
             )
 
-        price_trend = self._detect_price_trend()
-        volume_trend = self._detect_volume_trend()
-        price_range = self._calculate_price_range()
-        momentum = self._calculate_momentum()
+        (
+            price_change_pct, volume_change_pct, price_range, momentum,
+            earlier_min, earlier_max,
+        ) = _wyckoff_scan(
+            as_float_array([s.price for s in self._history]),
+            as_float_array([s.volume for s in self._history]),
+            self.config.trend_lookback_periods,
+            self.config.volume_lookback_periods,
+        )
+        price_trend = self._classify_price_trend(price_change_pct)
+        volume_trend = self._classify_volume_trend(volume_change_pct)
+        self._earlier_range = (earlier_min, earlier_max)
 
         phase, confidence, reason = self._detect_phase(
             price_trend, volume_trend, price_range, momentum
@@ -153,64 +257,24 @@ class WyckoffDetector:
             suggested_action=action,
         )
 
-    def _detect_price_trend(self) -> str:
-        lookback = self.config.trend_lookback_periods
-        prices = [s.price for s in self._history[-lookback:]]
-
-        if len(prices) < 3:
-            return "unknown"
-
-        first_half_avg = statistics.mean(prices[:len(prices)//2])
-        second_half_avg = statistics.mean(prices[len(prices)//2:])
-
-        if first_half_avg <= 0:
+    def _classify_price_trend(self, change_pct: float) -> str:
+        if math.isnan(change_pct):
             return "unknown"
-
-        change_pct = ((second_half_avg - first_half_avg) / first_half_avg) * 100
-
         if change_pct > self.config.sideways_threshold_pct:
             return "up"
         elif change_pct < -self.config.sideways_threshold_pct:
             return "down"
         return "sideways"
 
-    def _detect_volume_trend(self) -> str:
-        lookback = self.config.volume_lookback_periods
-        volumes = [s.volume for s in self._history[-lookback:] if s.volume > 0]
-
-        if len(volumes) < 4:
-            return "stable"
-
-        first_half_avg = statistics.mean(volumes[:len(volumes)//2])
-        second_half_avg = statistics.mean(volumes[len(volumes)//2:])
-
-        if first_half_avg <= 0:
+    def _classify_volume_trend(self, change_pct: float) -> str:
+        if math.isnan(change_pct):
             return "stable"
-
-        change_pct = ((second_half_avg - first_half_avg) / first_half_avg) * 100
-
         if change_pct > 30:
             return "increasing"
         elif change_pct < -30:
             return "decreasing"
         return "stable"
 
-    def _calculate_price_range(self) -> float:
-        lookback = self.config.trend_lookback_periods
-        prices = [s.price for s in self._history[-lookback:]]
-        if not prices or min(prices) <= 0:
-            return 0.0
-        return ((max(prices) - min(prices)) / min(prices)) * 100
-
-    def _calculate_momentum(self) -> float:
-        if len(self._history) < 5:
-            return 0.0
-        recent = self._history[-1].price
-        earlier = self._history[-5].price
-        if earlier <= 0:
-            return 0.0
-        return ((recent - earlier) / earlier) * 100
-
     def _detect_phase(
         self,
         price_trend: str,
@@ -301,21 +365,19 @@ class WyckoffDetector:
     def _was_recent_downtrend(self) -> bool:
         if len(self._history) < 30:
             return False
-        lookback = self.config.trend_lookback_periods
-        earlier_prices = [s.price for s in self._history[-(lookback*2):-(lookback)]]
-        if not earlier_prices or max(earlier_prices) <= 0:
+        earlier_min, earlier_max = self._earlier_range
+        if math.isnan(earlier_max) or earlier_max <= 0:
             return False
-        change = ((min(earlier_prices) - max(earlier_prices)) / max(earlier_prices)) * 100
+        change = ((earlier_min - earlier_max) / earlier_max) * 100
         return change < -self.config.markdown_min_loss_pct * 0.5
 
     def _was_recent_uptrend(self) -> bool:
         if len(self._history) < 30:
             return False
-        lookback = self.config.trend_lookback_periods
-        earlier_prices = [s.price for s in self._history[-(lookback*2):-(lookback)]]
-        if not earlier_prices or min(earlier_prices) <= 0:
+        earlier_min, earlier_max = self._earlier_range
+        if math.isnan(earlier_min) or earlier_min <= 0:
             return False
-        change = ((max(earlier_prices) - min(earlier_prices)) / min(earlier_prices)) * 100
+        change = ((earlier_max - earlier_min) / earlier_min) * 100
         return change > self.config.markup_min_gain_pct * 0.5
 
     def _generate_signal(
@@ -0,0 +1,50 @@
+"""
+Take-Profit Book — per-wallet take-profit targets.
+
+One target per wallet address, with its target price computed once when the
+target is set.
+"""
+
+from typing import Optional
+
+
+class TakeProfitBook:
+    """Take-profit targets keyed by wallet address."""
+
+    def __init__(self):
+        self._targets: dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._targets
+
+    def set(
+        self,
+        address: str,
+        token_mint: str,
+        profit_percentage: float,
+        initial_price: float,
+        auto_sell: bool = True,
+    ) -> dict:
+        """Add or replace the target for a wallet and return it."""
+        self._targets[address] = {
+            "token_mint": token_mint,
+            "profit_percentage": profit_percentage,
+            "initial_price": initial_price,
+            "auto_sell": auto_sell,
+            "target_price": initial_price * (1 + profit_percentage / 100.0),
+        }
+        return self.get(address)
+
+    def get(self, address: str) -> Optional[dict]:
+        target = self._targets.get(address)
+        return dict(target) if target is not None else None  # callers may not mutate the book
+
+    def remove(self, address: str) -> bool:
+        """Drop a wallet's target. Returns False if absent."""
+        return self._targets.pop(address, None) is not None
+
+    def clear(self):
+        self._targets.clear()
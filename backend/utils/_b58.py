@@ -0,0 +1,87 @@
+"""
+Base58 encode/decode.
+
+Uses the Rust-backed `based58` package when it is installed. The pure-Python
+fallback packs several base58 digits into each big-integer step (in the
+spirit of Bitcoin Core's 7/9-byte packing), so the quadratic bigint work is
+done once per group instead of once per character. Results are identical
+either way, and both raise ValueError on malformed input.
+"""
+
+try:
+    import based58 as _based58
+    HAVE_BASED58 = True
+except ImportError:
+    _based58 = None
+    HAVE_BASED58 = False
+
+_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+# ASCII code -> digit value, 0xFF for characters outside the alphabet. Used
+# with bytes.translate so the whole string is validated and mapped in C.
+_INVALID = 0xFF
+_DIGIT_TABLE = bytes(
+    _ALPHABET.index(c) if c in _ALPHABET else _INVALID for c in range(256)
+)
+
+# Base58 digits handled per big-integer multiply / divmod
+_DECODE_GROUP = 9
+_ENCODE_GROUP = 10
+_ENCODE_RADIX = 58 ** _ENCODE_GROUP
+
+
+def _decode_packed(value: bytes) -> bytes:
+    stripped = value.lstrip(b"1")
+    n_zeros = len(value) - len(stripped)  # each leading '1' is a zero byte
+
+    digits = stripped.translate(_DIGIT_TABLE)
+    bad = digits.find(_INVALID)
+    if bad >= 0:
+        raise ValueError(f"Invalid base58 character: {chr(stripped[bad])!r}")
+
+    acc = 0
+    for start in range(0, len(digits), _DECODE_GROUP):
+        group = digits[start:start + _DECODE_GROUP]
+        chunk = 0
+        for d in group:
+            chunk = chunk * 58 + d
+        acc = acc * 58 ** len(group) + chunk
+
+    return b"\0" * n_zeros + acc.to_bytes((acc.bit_length() + 7) // 8, "big")
+
+
+def _encode_packed(data: bytes) -> str:
+    stripped = data.lstrip(b"\0")
+    n_zeros = len(data) - len(stripped)
+
+    acc = int.from_bytes(stripped, "big")
+    out = bytearray()
+    alphabet = _ALPHABET
+    while acc:
+        acc, group = divmod(acc, _ENCODE_RADIX)
+        for _ in range(_ENCODE_GROUP):
+            group, d = divmod(group, 58)
+            out.append(alphabet[d])
+    # Least-significant digit first; the top group is zero-padded
+    while out and out[-1] == alphabet[0]:
+        out.pop()
+    out.reverse()
+    return "1" * n_zeros + out.decode("ascii")
+
+
+def b58decode(value) -> bytes:
+    """Decode a base58 str or bytes value."""
+    if isinstance(value, str):
+        try:
+            value = value.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("Invalid base58 string: non-ASCII characters") from None
+    if _based58 is not None:
+        return _based58.b58decode(value)
+    return _decode_packed(value)
+
+
+def b58encode(data: bytes) -> str:
+    """Encode bytes as a base58 str."""
+    if _based58 is not None:
+        return _based58.b58encode(data).decode("ascii")
+    return _encode_packed(data)
@@ -0,0 +1,40 @@
+"""
+Optional Numba JIT support.
+
+`njit` compiles numeric kernels with Numba when it is installed and is a
+no-op decorator otherwise, so the same plain-loop code runs either way.
+Kernels should be written as explicit loops over indexable sequences and
+avoid Python objects so they stay Numba-compatible.
+"""
+
+try:
+    import numpy as np
+    from numba import njit as _numba_njit
+    HAVE_NUMBA = True
+except ImportError:
+    np = None
+    _numba_njit = None
+    HAVE_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """`numba.njit` when available, otherwise return the function unchanged."""
+    if HAVE_NUMBA:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]  # used as bare @njit
+    return lambda fn: fn
+
+
+def as_float_array(values):
+    """Kernel input for a sequence of floats: float64 array under Numba, else a list."""
+    if HAVE_NUMBA:
+        return np.asarray(values, dtype=np.float64)
+    return list(values)
+
+
+def index_buffer(size: int):
+    """Output buffer of `size` row indices for a kernel: int64 array under Numba, else a list."""
+    if HAVE_NUMBA:
+        return np.empty(size, dtype=np.int64)
+    return [0] * size
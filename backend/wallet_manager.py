@@ -258,6 +258,10 @@ class EncryptedKeyStore:
 
 # ── Wallet Pool & Orchestrator ──────────────────────────────────────
 
+# How long an unchanged get_pool_status() snapshot may be reused
+POOL_STATUS_TTL_S = 0.5
+
+
 class WalletOrchestrator:
     """
     Manages a pool of 10-20 wallets with selection strategies,
@@ -270,6 +274,11 @@ class WalletOrchestrator:
         self._round_robin_index = 0
         self._lock = Lock()
         self._active_wallets: set[str] = set()  # Set of active wallet addresses
+        # get_pool_status() snapshot; dropped on any pool change, else reused
+        # for up to POOL_STATUS_TTL_S to absorb overlapping status polls
+        self._pool_status: Optional[dict] = None
+        self._pool_status_at: float = 0.0
+        self._keypairs: dict = {}  # address -> solders Keypair, see get_keypair()
 
     def register_wallet(
         self,
@@ -281,6 +290,8 @@ class WalletOrchestrator:
         with self._lock:
             info = WalletInfo(address=address, role=role, label=label)
             self._wallets[address] = info
+            self._pool_status = None
+            self._keypairs.pop(address, None)
             logger.info(f"Wallet registered: {address[:8]}... role={role.value}")
             return info
 
@@ -372,6 +383,7 @@ class WalletOrchestrator:
                 w.last_used = time.time()
                 w.total_trades += 1
                 w.health = WalletHealth.HEALTHY
+                self._pool_status = None
 
     def record_failure(self, address: str):
         with self._lock:
@@ -379,6 +391,7 @@ class WalletOrchestrator:
                 w = self._wallets[address]
                 w.recent_failures += 1
                 w.last_used = time.time()
+                self._pool_status = None
                 if w.recent_failures >= 5:
                     w.health = WalletHealth.UNHEALTHY
                     logger.warning(f"Wallet {address[:8]}... marked UNHEALTHY")
@@ -389,32 +402,47 @@ class WalletOrchestrator:
         with self._lock:
             if address in self._wallets:
                 self._wallets[address].balance_sol = balance_sol
+                self._pool_status = None
+
+    async def refresh_balances(self, rpc_url: Optional[str] = None, client=None):
+        """
+        Fetch current balances from Solana RPC for all wallets.
 
-    async def refresh_balances(self, rpc_url: str):
-        """Fetch current balances from Solana RPC for all wallets."""
-        from solana.rpc.async_api import AsyncClient
+        Pass a shared solana AsyncClient as `client` to reuse its connection;
+        otherwise a temporary client for `rpc_url` is opened and closed.
+        """
+        if client is None:
+            from solana.rpc.async_api import AsyncClient
+            async with AsyncClient(rpc_url) as own_client:
+                await self._fetch_balances(own_client)
+        else:
+            await self._fetch_balances(client)
+
+    async def _fetch_balances(self, client):
         from solders.pubkey import Pubkey
-        
-        async with AsyncClient(rpc_url) as client:
-            for address in list(self._wallets.keys()):
-                try:
-                    pubkey = Pubkey.from_string(address)
-                    resp = await client.get_balance(pubkey)
-                    if resp.value is not None:
-                        balance_sol = resp.value / 1e9  # Convert lamports to SOL
-                        self.update_balance(address, balance_sol)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch balance for {address[:8]}...: {e}")
+
+        for address in list(self._wallets.keys()):
+            try:
+                pubkey = Pubkey.from_string(address)
+                resp = await client.get_balance(pubkey)
+                if resp.value is not None:
+                    balance_sol = resp.value / 1e9  # Convert lamports to SOL
+                    self.update_balance(address, balance_sol)
+            except Exception as e:
+                logger.warning(f"Failed to fetch balance for {address[:8]}...: {e}")
 
     def update_exposure(self, address: str, exposure: float):
         with self._lock:
             if address in self._wallets:
                 self._wallets[address].current_exposure = exposure
+                self._pool_status = None
 
     def disable_wallet(self, address: str):
         with self._lock:
             if address in self._wallets:
                 self._wallets[address].health = WalletHealth.DISABLED
+                self._pool_status = None
+                self._keypairs.pop(address, None)
                 logger.info(f"Wallet {address[:8]}... disabled")
 
     def enable_wallet(self, address: str):
@@ -422,23 +450,52 @@ class WalletOrchestrator:
             if address in self._wallets:
                 self._wallets[address].health = WalletHealth.HEALTHY
                 self._wallets[address].recent_failures = 0
+                self._pool_status = None
+                self._keypairs.pop(address, None)
                 logger.info(f"Wallet {address[:8]}... re-enabled")
 
     # ── Pool Status ─────────────────────────────────────────────────
 
     def get_pool_status(self) -> dict:
         with self._lock:
-            wallets = [w.to_dict() for w in self._wallets.values()]
-            return {
-                "total_wallets": len(self._wallets),
-                "healthy": sum(1 for w in self._wallets.values() if w.health == WalletHealth.HEALTHY),
-                "degraded": sum(1 for w in self._wallets.values() if w.health == WalletHealth.DEGRADED),
-                "unhealthy": sum(1 for w in self._wallets.values() if w.health == WalletHealth.UNHEALTHY),
-                "disabled": sum(1 for w in self._wallets.values() if w.health == WalletHealth.DISABLED),
-                "total_balance_sol": sum(w.balance_sol for w in self._wallets.values()),
-                "total_exposure_sol": sum(w.current_exposure for w in self._wallets.values()),
-                "wallets": wallets,
-            }
+            now = time.monotonic()
+            if self._pool_status is None or now - self._pool_status_at >= POOL_STATUS_TTL_S:
+                self._pool_status = self._build_pool_status()
+                self._pool_status_at = now
+            return dict(self._pool_status)  # shallow copy: callers may add keys
+
+    def _build_pool_status(self) -> dict:
+        """One pass over the pool. Caller holds self._lock."""
+        health_counts = dict.fromkeys(WalletHealth, 0)
+        total_balance = 0.0
+        total_exposure = 0.0
+        wallets = []
+        for w in self._wallets.values():
+            health_counts[w.health] += 1
+            total_balance += w.balance_sol
+            total_exposure += w.current_exposure
+            wallets.append(w.to_dict())
+        return {
+            "total_wallets": len(self._wallets),
+            "healthy": health_counts[WalletHealth.HEALTHY],
+            "degraded": health_counts[WalletHealth.DEGRADED],
+            "unhealthy": health_counts[WalletHealth.UNHEALTHY],
+            "disabled": health_counts[WalletHealth.DISABLED],
+            "total_balance_sol": total_balance,
+            "total_exposure_sol": total_exposure,
+            "wallets": wallets,
+        }
+
+    def iter_wallets(self):
+        """Yield each wallet's public info dict in turn (for streaming responses)."""
+        with self._lock:
+            wallets = list(self._wallets.values())
+        for w in wallets:
+            yield w.to_dict()
+
+    def wallet_count(self) -> int:
+        """Number of registered wallets (no pool snapshot needed)."""
+        return len(self._wallets)
 
     def get_wallet_info(self, address: str) -> Optional[dict]:
         with self._lock:
@@ -453,6 +510,33 @@ class WalletOrchestrator:
         """
         return self.keystore.get_key(address)
 
+    def get_keypair(self, address: str):
+        """
+        Get the solders Keypair for signing, built once per wallet and cached
+        until the wallet is re-registered, disabled, enabled or removed.
+        Returns None if the keystore has no key for the address.
+        """
+        with self._lock:
+            keypair = self._keypairs.get(address)
+        if keypair is not None:
+            return keypair
+
+        from solders.keypair import Keypair
+
+        key_bytes = self.keystore.get_key(address)
+        if not key_bytes:
+            return None
+        if len(key_bytes) == 64:
+            keypair = Keypair.from_bytes(key_bytes)
+        elif len(key_bytes) == 32:
+            keypair = Keypair.from_seed(key_bytes)
+        else:
+            raise ValueError(f"Invalid key length: {len(key_bytes)} (expected 32 or 64)")
+
+        with self._lock:
+            self._keypairs[address] = keypair
+        return keypair
+
     # ── Active Wallet Management ──────────────────────────────────────
 
     def set_active_wallets(self, addresses: list[str]):
@@ -480,8 +564,10 @@ class WalletOrchestrator:
         """Remove a wallet from the pool and from the encrypted keystore. Returns True if removed."""
         with self._lock:
             self._active_wallets.discard(address)
+            self._keypairs.pop(address, None)
             if address in self._wallets:
                 del self._wallets[address]
+                self._pool_status = None
                 removed = self.keystore.remove_key(address)
                 if removed:
                     logger.info(f"Wallet removed from pool: {address[:8]}...")
@@ -494,6 +580,8 @@ class WalletOrchestrator:
             addresses = list(self._wallets.keys())
             self._wallets.clear()
             self._active_wallets.clear()
+            self._pool_status = None
+            self._keypairs.clear()
             self._round_robin_index = 0
         count = self.keystore.clear_all()
         logger.info("Wallet pool reset to blank slate")
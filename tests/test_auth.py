@@ -0,0 +1,101 @@
+"""
+API key checks and the per-request auth context.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from backend import auth
+from backend.auth import AuthContext, auth_ctx, require_api_key
+
+
+@pytest.fixture
+def api_key():
+    key = auth.generate_api_key()
+    yield key
+    auth._valid_key_hashes.discard(auth._hash_key(key))
+
+
+@pytest.fixture
+def request_context():
+    tokens = []
+
+    def set_context(ctx: AuthContext):
+        tokens.append(auth_ctx.set(ctx))
+
+    yield set_context
+    for token in reversed(tokens):
+        auth_ctx.reset(token)
+
+
+def test_require_api_key_trusts_a_key_the_middleware_validated(api_key, request_context):
+    request_context(AuthContext(client_ip="10.0.0.1", api_key=api_key, localhost_bypass=False))
+    assert asyncio.run(require_api_key(api_key=None)) == api_key
+
+
+def test_localhost_bypass_does_not_satisfy_require_api_key(request_context):
+    request_context(AuthContext(client_ip="127.0.0.1", api_key=None, localhost_bypass=True))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(require_api_key(api_key=None))
+    assert exc.value.status_code == 401
+
+
+def test_require_api_key_without_middleware_validates_the_header(api_key):
+    assert asyncio.run(require_api_key(api_key=api_key)) == api_key
+    with pytest.raises(HTTPException):
+        asyncio.run(require_api_key(api_key="smm_wrong"))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(auth, "time", fake)
+    return fake
+
+
+def test_rate_limiter_allows_a_full_burst_then_rejects(clock):
+    limiter = auth.RateLimiter(max_requests=10, window_seconds=60)
+    assert all(limiter.is_allowed("1.2.3.4") for _ in range(10))
+    assert not limiter.is_allowed("1.2.3.4")
+    assert limiter.get_remaining("1.2.3.4") == 0
+    assert limiter.is_allowed("5.6.7.8")  # budgets are per IP
+
+
+def test_rate_limiter_refills_one_request_per_emission_interval(clock):
+    limiter = auth.RateLimiter(max_requests=10, window_seconds=60)  # one per 6s
+    start = clock.now
+    for _ in range(10):
+        limiter.is_allowed("1.2.3.4")
+
+    clock.now = start + 5.9
+    assert not limiter.is_allowed("1.2.3.4")
+    clock.now = start + 6.0
+    assert limiter.is_allowed("1.2.3.4")
+    assert not limiter.is_allowed("1.2.3.4")
+
+    clock.now += 60
+    assert limiter.get_remaining("1.2.3.4") == 10
+    assert all(limiter.is_allowed("1.2.3.4") for _ in range(10))
+
+
+def test_rate_limiter_sweep_drops_only_recovered_ips(clock):
+    limiter = auth.RateLimiter(max_requests=10, window_seconds=60)
+    limiter.is_allowed("1.2.3.4")
+    clock.now += 3
+    limiter.is_allowed("5.6.7.8")
+    clock.now += 3.5  # first IP recovered, second still 2.5s ahead
+
+    removed = sum(limiter.sweep_next_shard() for _ in range(limiter.NUM_SHARDS))
+    assert removed == 1
+    assert not any("1.2.3.4" in shard for shard in limiter._shards)
+    assert any("5.6.7.8" in shard for shard in limiter._shards)
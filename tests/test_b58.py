@@ -0,0 +1,59 @@
+"""
+Base58 codec against known vectors, for the public functions and the
+pure-Python packed fallback (used when based58 is not installed).
+"""
+
+import os
+
+import pytest
+
+from backend.utils import _b58
+from backend.utils._b58 import b58decode, b58encode
+
+# Bitcoin Core's base58_encode_decode.json vectors (hex -> base58)
+VECTORS = [
+    ("", ""),
+    ("61", "2g"),
+    ("626262", "a3gV"),
+    ("636363", "aPEr"),
+    ("73696d706c792061206c6f6e6720737472696e67", "2cFupjhnEsSn59qHXstmK2ffpLv2"),
+    ("00eb15231dfceb60925886b67d065299925915aeb172c06647", "1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L"),
+    ("516b6fcd0f", "ABnLTmg"),
+    ("bf4f89001e670274dd", "3SEo3LWLoPntC"),
+    ("572e4794", "3EFU7m"),
+    ("ecac89cad93923c02321", "EJDM8drfXA6uyA"),
+    ("10c8511e", "Rt5zm"),
+    ("00000000000000000000", "1111111111"),
+]
+
+CODECS = {
+    "public": (b58encode, b58decode),
+    "packed-fallback": (_b58._encode_packed, _b58._decode_packed),
+}
+
+
+@pytest.fixture(params=CODECS.values(), ids=CODECS.keys())
+def codec(request):
+    return request.param
+
+
+@pytest.mark.parametrize("hex_data, encoded", VECTORS)
+def test_known_vectors(codec, hex_data, encoded):
+    encode, decode = codec
+    data = bytes.fromhex(hex_data)
+    assert encode(data) == encoded
+    assert decode(encoded.encode()) == data
+
+
+@pytest.mark.parametrize("size", [1, 9, 10, 11, 32, 64, 65])
+def test_round_trip_across_group_boundaries(codec, size):
+    encode, decode = codec
+    for data in (os.urandom(size), b"\0\0" + os.urandom(size), b"\xff" * size):
+        assert decode(encode(data).encode()) == data
+
+
+def test_public_decode_accepts_str_and_rejects_bad_input():
+    assert b58decode("StV1DL6CwTryKyV") == b"hello world"
+    for bad in ("0OIl", "abc!", "café"):
+        with pytest.raises(ValueError):
+            b58decode(bad)
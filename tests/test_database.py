@@ -0,0 +1,124 @@
+"""
+SQLite persistence helpers, run against a throwaway database file.
+"""
+
+import pytest
+
+from backend import database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    database.close_pooled_connections()
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "trading.db")
+    database.init_database()
+    yield
+    database.close_pooled_connections()
+
+
+def _legacy_upsert_position(wallet_address, token_mint, quantity_delta, price):
+    """The read-modify-write upsert_position that ON CONFLICT replaced."""
+    with database.get_connection() as conn:
+        existing = conn.execute(
+            "SELECT * FROM positions WHERE wallet_address = ? AND token_mint = ?",
+            (wallet_address, token_mint),
+        ).fetchone()
+
+        if existing:
+            old_qty = existing["quantity"]
+            old_avg = existing["average_entry_price"] or 0
+
+            new_qty = old_qty + quantity_delta
+
+            if quantity_delta > 0 and old_qty >= 0:
+                total_cost = (old_qty * old_avg) + (quantity_delta * price)
+                new_avg = total_cost / new_qty if new_qty > 0 else 0
+            elif quantity_delta < 0:
+                realized = abs(quantity_delta) * (price - old_avg)
+                conn.execute(
+                    "UPDATE positions SET realized_pnl = realized_pnl + ? WHERE position_id = ?",
+                    (realized, existing["position_id"]),
+                )
+                new_avg = old_avg
+            else:
+                new_avg = old_avg
+
+            if new_qty <= 0:
+                conn.execute(
+                    "UPDATE positions SET quantity = 0, closed_at = ?, current_price = ? WHERE position_id = ?",
+                    (1.0, price, existing["position_id"]),
+                )
+            else:
+                conn.execute(
+                    """UPDATE positions SET
+                       quantity = ?, average_entry_price = ?, current_price = ?
+                       WHERE position_id = ?""",
+                    (new_qty, new_avg, price, existing["position_id"]),
+                )
+        else:
+            conn.execute(
+                """INSERT INTO positions
+                   (position_id, wallet_address, token_mint, quantity,
+                    average_entry_price, current_price, opened_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (database._new_id(), wallet_address, token_mint,
+                 max(0, quantity_delta), price, price, 1.0),
+            )
+
+
+def _position(wallet_address):
+    with database.get_connection() as conn:
+        row = conn.execute(
+            """SELECT quantity, average_entry_price, realized_pnl, current_price,
+                      closed_at IS NOT NULL AS closed
+               FROM positions WHERE wallet_address = ?""",
+            (wallet_address,),
+        ).fetchone()
+    return tuple(row)
+
+
+TRADE_SEQUENCES = {
+    "open-and-add": [(1.0, 0.5), (2.0, 0.8)],
+    "partial-sell": [(3.0, 1.0), (-1.0, 1.5)],
+    "sell-at-loss": [(2.0, 1.0), (-0.5, 0.4)],
+    "close-exactly": [(1.0, 1.0), (-1.0, 2.0)],
+    "oversell": [(1.0, 1.0), (-2.5, 1.2)],
+    "reopen-after-close": [(1.0, 1.0), (-1.0, 1.1), (2.0, 0.9)],
+    "first-trade-is-sell": [(-1.0, 1.0), (1.0, 2.0)],
+    "zero-delta": [(1.0, 1.0), (0.0, 3.0)],
+}
+
+
+@pytest.mark.parametrize("trades", TRADE_SEQUENCES.values(), ids=TRADE_SEQUENCES.keys())
+def test_upsert_position_matches_read_modify_write(db, trades):
+    for delta, price in trades:
+        database.upsert_position("new-wallet", "mint", delta, price)
+        _legacy_upsert_position("old-wallet", "mint", delta, price)
+        assert _position("new-wallet") == pytest.approx(_position("old-wallet"))
+
+
+def _audit_row(actor):
+    return (database._AUDIT_INSERT_SQL,
+            (1.0, "test", actor, "write", "resource", "success", None, None))
+
+
+def _audit_actors():
+    with database.get_connection() as conn:
+        return [row[0] for row in conn.execute("SELECT actor FROM audit_log ORDER BY id")]
+
+
+def test_write_batch_retries_row_by_row_and_counts_poisoned_rows(db):
+    dropped_before = database.get_dropped_write_count()
+    batch = [_audit_row("a"), _audit_row(None), _audit_row("b")]  # actor is NOT NULL
+
+    database._write_batch(batch)
+
+    assert _audit_actors() == ["a", "b"]
+    assert database.get_dropped_write_count() == dropped_before + 1
+
+
+def test_write_batch_commits_a_clean_batch_without_drops(db):
+    dropped_before = database.get_dropped_write_count()
+    database._write_batch([_audit_row("a"), _audit_row("b")])
+    assert _audit_actors() == ["a", "b"]
+    assert database.get_dropped_write_count() == dropped_before
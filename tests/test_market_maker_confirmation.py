@@ -0,0 +1,68 @@
+"""
+A swap sent without preflight must not be marked FILLED unless it confirms.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("solana")
+
+from backend import market_maker_v2
+from backend.market_maker_v2 import MarketMakerV2
+from backend.order_manager import Order, OrderManager, OrderSide, OrderState, RetryConfig
+
+
+class StubRpc:
+    """Never reports a status for the signature; blockhash validity is fixed."""
+
+    def __init__(self, blockhash_valid: bool):
+        self.blockhash_valid = blockhash_valid
+        self.status_polls = 0
+
+    async def get_signature_statuses(self, signatures):
+        self.status_polls += 1
+        return SimpleNamespace(value=[None])
+
+    async def get_fee_for_message(self, message):
+        return SimpleNamespace(value=5000 if self.blockhash_valid else None)
+
+
+def _execute(rpc: StubRpc) -> Order:
+    mm = MarketMakerV2.__new__(MarketMakerV2)  # only the confirmation path is exercised
+
+    async def swap_function(**kwargs):
+        await mm._wait_for_confirmation(rpc, "sig" * 20, message=None, timeout_s=0)
+        return {"tx_signature": "sig" * 20, "fill_price": 1.0}
+
+    order = Order(
+        order_id="order-1", wallet_address="wallet", token_mint="mint",
+        side=OrderSide.BUY, amount_sol=0.1,
+    )
+    manager = OrderManager(RetryConfig(max_attempts=2, initial_delay_s=0))
+    manager.create_order(order)
+    return asyncio.run(manager.execute_order(order, swap_function))
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(market_maker_v2, "CONFIRM_POLL_INITIAL_S", 0)
+    monkeypatch.setattr(market_maker_v2, "CONFIRM_POLL_MAX_S", 0)
+    monkeypatch.setattr(market_maker_v2, "CONFIRM_MAX_WAIT_S", 0)
+
+
+def test_expired_blockhash_is_retried_then_rejected():
+    rpc = StubRpc(blockhash_valid=False)
+    order = _execute(rpc)
+    assert order.state == OrderState.REJECTED
+    assert "TransactionExpiredBlockheightExceededError" in order.error_message
+    assert order.retry_count == 2  # retryable: both attempts ran
+
+
+def test_unconfirmed_with_live_blockhash_is_rejected_without_retry():
+    rpc = StubRpc(blockhash_valid=True)
+    order = _execute(rpc)
+    assert order.state == OrderState.REJECTED
+    assert "may still confirm" in order.error_message
+    assert order.retry_count == 1
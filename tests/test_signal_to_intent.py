@@ -0,0 +1,61 @@
+"""
+Wyckoff signals map to trade sides; HOLD and NO_ACTION never trade.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.market_maker_v2 import MarketMakerV2, TradingConfig
+from backend.phase_config import BondingCurvePhase, get_phase_config
+from backend.strategy.wyckoff import TradeSignal
+
+
+class StubCalculator:
+    async def calculate(self, signal, phase_config):
+        return 0.1
+
+
+def _market_maker(phase: BondingCurvePhase) -> MarketMakerV2:
+    mm = MarketMakerV2.__new__(MarketMakerV2)  # only the signal mapping is exercised
+    mm.token_mint = "mint"
+    mm.trading_config = TradingConfig(min_confidence=0.4)
+    mm.phase_config = get_phase_config(phase)
+    mm.trade_calculator = StubCalculator()
+    mm.wallet_orchestrator = SimpleNamespace(
+        get_wallet=lambda strategy, min_balance: SimpleNamespace(address="wallet"),
+    )
+    mm.capital_brain = SimpleNamespace(sol_to_usd=lambda sol: sol * 100.0)
+    mm._rebuild_intent_factory()
+    return mm
+
+
+def _intent(mm: MarketMakerV2, signal: TradeSignal):
+    analysis = SimpleNamespace(signal=signal, confidence=0.9, reason="test")
+    return asyncio.run(mm._signal_to_intent(analysis, price=1.0))
+
+
+@pytest.mark.parametrize("signal, side", [
+    (TradeSignal.BUY, "buy"),
+    (TradeSignal.STRONG_BUY, "buy"),
+    (TradeSignal.SELL, "sell"),
+    (TradeSignal.STRONG_SELL, "sell"),
+])
+def test_actionable_signals_map_to_sides(signal, side):
+    intent = _intent(_market_maker(BondingCurvePhase.STABILIZATION), signal)
+    assert intent is not None
+    assert intent.side == side
+
+
+@pytest.mark.parametrize("phase", list(BondingCurvePhase))
+@pytest.mark.parametrize("signal", [TradeSignal.HOLD, TradeSignal.NO_ACTION])
+def test_hold_and_no_action_never_trade(phase, signal):
+    assert _intent(_market_maker(phase), signal) is None
+
+
+def test_force_buy_mode_blocks_sells():
+    mm = _market_maker(BondingCurvePhase.STEALTH_ACCUMULATION)
+    assert mm.phase_config.force_buy_mode
+    assert _intent(mm, TradeSignal.SELL) is None
+    assert _intent(mm, TradeSignal.BUY).side == "buy"
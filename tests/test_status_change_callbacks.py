@@ -0,0 +1,69 @@
+"""
+Component state changes call on_change so the WebSocket status is pushed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from backend.capital_brain import CapitalBrain
+from backend.risk_manager import RiskManager, TradeIntent
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+
+class StubJupiter:
+    def __init__(self, price: float):
+        self.price = price
+
+    async def get_price(self, mint):
+        return self.price
+
+
+def _orchestrator(balance_sol: float):
+    return SimpleNamespace(get_pool_status=lambda: {"total_balance_sol": balance_sol})
+
+
+def test_capital_brain_notifies_on_fill_and_changed_refresh():
+    changed = Counter()
+    brain = CapitalBrain(1000.0, StubJupiter(100.0), on_change=changed)
+
+    asyncio.run(brain.refresh(_orchestrator(2.0)))
+    assert changed.calls == 1
+
+    asyncio.run(brain.refresh(_orchestrator(2.0)))  # price cached, pool not rescanned
+    assert changed.calls == 1
+
+    brain.on_fill(-0.5)
+    assert changed.calls == 2
+
+
+def test_risk_manager_notifies_on_trades_and_shutdown():
+    changed = Counter()
+    risk = RiskManager(on_change=changed)
+    intent = TradeIntent(
+        wallet_address="wallet", token_mint="mint", side="buy",
+        amount_sol=0.1, expected_price=1.0,
+    )
+
+    risk.record_trade_executed(intent, success=True)
+    risk.emergency_shutdown()
+    risk.reset_emergency()
+    assert changed.calls == 3
+
+
+def test_reconcile_picks_up_balance_changes_between_refreshes():
+    changed = Counter()
+    brain = CapitalBrain(1000.0, StubJupiter(100.0), on_change=changed)
+    asyncio.run(brain.refresh(_orchestrator(2.0)))
+    assert brain.deployed_capital_usd == 200.0
+
+    brain.reconcile(_orchestrator(3.0))  # e.g. after refresh_balances()
+    assert brain.deployed_capital_usd == 300.0
+    assert brain.get_status()["deployed_capital_sol"] == 3.0
+    assert changed.calls == 2